@@ -2,7 +2,9 @@
 Core dependencies and configurations for the API
 """
 
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 from dotenv import load_dotenv
 
@@ -76,6 +78,9 @@ class BaseTranslationService:
 # Global service instance
 base_translation_service: Optional[BaseTranslationService] = None
 
+# Worker processes for CPU-heavy document extraction (PDF)
+document_pool: Optional[ProcessPoolExecutor] = None
+
 
 def get_base_translation_service() -> BaseTranslationService:
     """Dependency to get base translation service"""
@@ -107,3 +112,29 @@ def init_translation_service():
     )
 
     return base_translation_service
+
+
+def init_document_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Start the document extraction process pool (one worker per CPU by default)"""
+    global document_pool
+
+    # Spawned rather than forked: the server process runs threads
+    document_pool = ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    return document_pool
+
+
+def get_document_pool() -> Optional[ProcessPoolExecutor]:
+    """Document extraction process pool, or None when it hasn't been started"""
+    return document_pool
+
+
+def shutdown_document_pool():
+    """Stop the document extraction process pool"""
+    global document_pool
+
+    if document_pool is not None:
+        document_pool.shutdown(cancel_futures=True)
+        document_pool = None
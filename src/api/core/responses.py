@@ -0,0 +1,25 @@
+"""
+Response classes shared by the API
+"""
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when installed, the stdlib encoder otherwise"""
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+def model_response(model: BaseModel) -> FastJSONResponse:
+    """Serialize an already-built response model, without FastAPI validating it again"""
+    return FastJSONResponse(model.model_dump(mode="json"))
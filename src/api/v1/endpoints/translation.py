@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 
 from api.core.dependencies import get_translation_service
+from api.core.responses import FastJSONResponse, model_response
 from api.v1.schemas import (
     DocumentInfoResponse,
     DocumentTranslationRequest,
@@ -30,14 +31,16 @@ router = APIRouter(prefix="/translation", tags=["translation"])
 
 @router.post(
     "/text",
-    response_model=TextTranslationResponse,
+    # Built and validated in the handler; listed for the docs only
+    response_model=None,
+    responses={200: {"model": TextTranslationResponse}},
     summary="Translate text or list of texts",
     description="Translate a single text or list of texts with context-aware translation",
 )
 async def translate_text(
     request: TextTranslationRequest,
     service: TranslationService = Depends(get_translation_service),
-) -> TextTranslationResponse:
+) -> FastJSONResponse:
     """Translate text or list of texts"""
 
     try:
@@ -54,7 +57,7 @@ async def translate_text(
             batch_size=request.batch_size,
         )
 
-        return TextTranslationResponse(
+        response = TextTranslationResponse(
             success=True,
             translated_text=translated_text,
             source_lang=request.source_lang.value if request.source_lang else "auto",
@@ -63,6 +66,7 @@ async def translate_text(
             text_count=len(request.text) if isinstance(request.text, list) else 1,
             processing_time=0.0,  # Will be updated by service
         )
+        return model_response(response)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -70,7 +74,8 @@ async def translate_text(
 
 @router.post(
     "/document/upload",
-    response_model=DocumentTranslationResponse,
+    response_model=None,
+    responses={200: {"model": DocumentTranslationResponse}},
     summary="Upload and translate document",
     description="Upload a document file and translate it",
 )
@@ -84,7 +89,7 @@ async def translate_uploaded_document(
     context: Optional[str] = Form(default=None, description="Translation context"),
     glossary: Optional[str] = Form(default=None, description="Glossary as JSON string"),
     service: TranslationService = Depends(get_translation_service),
-) -> DocumentTranslationResponse:
+) -> FastJSONResponse:
     """Upload and translate document"""
 
     # Create temporary file
@@ -121,13 +126,13 @@ async def translate_uploaded_document(
             glossary=parsed_glossary,
         )
 
-        return DocumentTranslationResponse(**result)
+        return model_response(DocumentTranslationResponse(**result))
 
     except HTTPException:
         raise
     except Exception as e:
         # Return a proper error response that matches the schema
-        return DocumentTranslationResponse(
+        response = DocumentTranslationResponse(
             success=False,
             error=str(e),
             original_file=temp_file.name if temp_file else "unknown",
@@ -141,6 +146,7 @@ async def translate_uploaded_document(
             file_type=None,
             processing_time=0.0,
         )
+        return model_response(response)
     finally:
         # Clean up temporary file
         if temp_file and os.path.exists(temp_file.name):
@@ -149,7 +155,8 @@ async def translate_uploaded_document(
 
 @router.post(
     "/document/path",
-    response_model=DocumentTranslationResponse,
+    response_model=None,
+    responses={200: {"model": DocumentTranslationResponse}},
     summary="Translate document by file path",
     description="Translate a document by providing its file path",
 )
@@ -157,7 +164,7 @@ async def translate_document_by_path(
     request: DocumentTranslationRequest,
     file_path: str,
     service: TranslationService = Depends(get_translation_service),
-) -> DocumentTranslationResponse:
+) -> FastJSONResponse:
     """Translate document by file path"""
 
     try:
@@ -176,13 +183,13 @@ async def translate_document_by_path(
             output_path=request.output_path,
         )
 
-        return DocumentTranslationResponse(**result)
+        return model_response(DocumentTranslationResponse(**result))
 
     except HTTPException:
         raise
     except Exception as e:
         # Return a proper error response that matches the schema
-        return DocumentTranslationResponse(
+        response = DocumentTranslationResponse(
             success=False,
             error=str(e),
             original_file=file_path,
@@ -196,21 +203,23 @@ async def translate_document_by_path(
             file_type=None,
             processing_time=0.0,
         )
+        return model_response(response)
 
 @router.get(
     "/formats",
-    response_model=SupportedFormatsResponse,
+    response_model=None,
+    responses={200: {"model": SupportedFormatsResponse}},
     summary="Get supported formats",
     description="Get list of supported document formats",
 )
 async def get_supported_formats(
     service: TranslationService = Depends(get_translation_service),
-) -> SupportedFormatsResponse:
+) -> FastJSONResponse:
     """Get supported document formats"""
 
     try:
         result = service.get_supported_formats()
-        return SupportedFormatsResponse(**result)
+        return model_response(SupportedFormatsResponse(**result))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -218,13 +227,15 @@ async def get_supported_formats(
 
 @router.get(
     "/health",
-    response_model=HealthResponse,
+    response_model=None,
+    responses={200: {"model": HealthResponse}},
     summary="Health check",
     description="Check API health status",
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> FastJSONResponse:
     """Health check endpoint"""
 
-    return HealthResponse(
+    response = HealthResponse(
         status="healthy", timestamp=datetime.now().isoformat(), version="1.0.0"
     )
+    return model_response(response)
@@ -8,25 +8,15 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from api.core.config import settings
-from processors.base import BaseDocumentProcessor
-from processors.docx_processor import DOCXProcessor
-from processors.pdf_processor import PDFProcessor
-from processors.pptx_processor import PPTXProcessor
-from processors.txt_processor import TXTProcessor
-from processors.xlsx_processor import XLSXProcessor
+from processors.base import BaseDocumentProcessor, LazyProcessorMap
 
 
 class DocumentProcessingService:
     """Service for processing documents using the processor classes"""
 
     def __init__(self):
-        self.processors = {
-            ".txt": TXTProcessor(),
-            ".pdf": PDFProcessor(),
-            ".docx": DOCXProcessor(),
-            ".pptx": PPTXProcessor(),
-            ".xlsx": XLSXProcessor(),
-        }
+        # Each processor (and its document library) is loaded on first use
+        self.processors = LazyProcessorMap()
 
     def get_processor(self, file_extension: str) -> BaseDocumentProcessor:
         """Get appropriate processor for file type"""
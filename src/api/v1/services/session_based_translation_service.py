@@ -2,15 +2,18 @@
 Enhanced translation service using existing processors with session management
 """
 
+import asyncio
 import logging
 import time
 import copy
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-from api.core.dependencies import BaseTranslationService
+from anyio import to_thread
+
+from api.core.dependencies import BaseTranslationService, get_document_pool
 from api.v1.services.session_service import SessionService
-from processors.base import DocumentProcessor
+from processors.base import DocumentProcessor, extract_document
 from core.agent import TranslationAgent
 
 
@@ -100,11 +103,21 @@ class EnhancedTranslationService:
             processor = self.document_processor._get_processor(file_ext)
             print(f"Using processor: {processor.__class__.__name__}")
             # Extract content using existing processor
-            original_content = processor.extract_text(file_path)
+            # PyMuPDF/python-docx work is blocking; PDFs go to the extraction process pool
+            # (CPU-bound), everything else to the worker threads
+            pool = get_document_pool()
+            if file_ext == ".pdf" and pool is not None:
+                original_content = await asyncio.get_running_loop().run_in_executor(
+                    pool, extract_document, file_ext, file_path
+                )
+            else:
+                original_content = await to_thread.run_sync(processor.extract_text, file_path)
             print("Content extracted successfully")
             # Get translatable texts using existing processor method
             print(original_content)
-            translatable_texts = processor.get_translatable_texts(original_content)
+            translatable_texts = await to_thread.run_sync(
+                processor.get_translatable_texts, original_content
+            )
             print(f"Found {len(translatable_texts)} translatable texts")
             if not translatable_texts:
                 raise ValueError("No translatable text found in document")
@@ -315,7 +328,8 @@ class EnhancedTranslationService:
             processor = self.document_processor._get_processor(session.file_type)
             
             # Reconstruct document using existing processor method
-            final_path = processor.reconstruct_document(
+            final_path = await to_thread.run_sync(
+                processor.reconstruct_document,
                 session.file_path,
                 session.translated_content,
                 output_path
@@ -5,11 +5,13 @@ Core package for translation agent
 from .agent import TranslationAgent
 from .chatbot import TranslationChatbot
 from .dictionary_manager import DictionaryManager
+from .translation_cache import TranslationCache
 from .translation_engine import TranslationEngine
 
 __all__ = [
     "TranslationAgent",
     "TranslationEngine",
+    "TranslationCache",
     "DictionaryManager",
     "TranslationChatbot",
 ]
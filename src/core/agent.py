@@ -311,40 +311,33 @@ class TranslationAgent:
     ) -> Dict[str, Any]:
         """Translate all text content in document structure"""
 
+        # Collect every text slot first so repeated texts are translated once, in batches
+        slots = []
+
         if "text" in content:
             # Simple text file
-            content["text"] = await self.translation_engine.translate_text(
-                content["text"], target_lang, source_lang, custom_dict
-            )
+            slots.append((content, "text"))
 
         elif "paragraphs" in content:
             # DOCX file
             for para in content["paragraphs"]:
-                para["text"] = await self.translation_engine.translate_text(
-                    para["text"], target_lang, source_lang, custom_dict
-                )
+                slots.append((para, "text"))
 
                 # Translate individual runs
                 for run in para["runs"]:
                     if run["text"].strip():
-                        run["text"] = await self.translation_engine.translate_text(
-                            run["text"], target_lang, source_lang, custom_dict
-                        )
+                        slots.append((run, "text"))
 
         elif "pages" in content:
             # PDF file
             for page in content["pages"]:
-                page["text"] = await self.translation_engine.translate_text(
-                    page["text"], target_lang, source_lang, custom_dict
-                )
+                slots.append((page, "text"))
 
         elif "slides" in content:
             # PPTX file
             for slide in content["slides"]:
                 for frame in slide["text_frames"]:
-                    frame["text"] = await self.translation_engine.translate_text(
-                        frame["text"], target_lang, source_lang, custom_dict
-                    )
+                    slots.append((frame, "text"))
 
         elif "sheets" in content:
             # XLSX file
@@ -352,11 +345,16 @@ class TranslationAgent:
                 for row in sheet["cells"]:
                     for cell in row:
                         if cell["value"].strip():
-                            cell["value"] = (
-                                await self.translation_engine.translate_text(
-                                    cell["value"], target_lang, source_lang, custom_dict
-                                )
-                            )
+                            slots.append((cell, "value"))
+
+        translated_texts = await self.translation_engine.translate_many(
+            [container[key] for container, key in slots],
+            target_lang,
+            source_lang,
+            custom_dict,
+        )
+        for (container, key), translated in zip(slots, translated_texts):
+            container[key] = translated
 
         return content
 
@@ -2,18 +2,190 @@
 React Agent for translation editing using LLM with specialized tools
 """
 
+import ast
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 from core.llm_manager import LLMManager
-from core.tools.base import ToolRegistry
+from core.tools.base import SessionContentRef, ToolRegistry
 from core.tools.pptx_tools import PPTXSearchTool, PPTXReplaceTool, PPTXAnalyzeTool, PPTXSlideInfoTool
 from core.tools.docx_tools import DOCXSearchTool, DOCXReplaceTool, DOCXAnalyzeTool
-from core.tools.excel_tools import ExcelSearchTool, ExcelReplaceTool, ExcelAnalyzeTool, ExcelGetRangeTool
+from core.tools.excel_tools import ExcelSearchTool, ExcelReplaceTool, ExcelFindReplaceTool, ExcelAnalyzeTool, ExcelGetRangeTool
 
 logger = logging.getLogger(__name__)
 
+# Below DEBUG; used for full planner prompts, which embed every tool schema
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+# Conversation history compaction: once the history grows past either limit,
+# older turns are folded into a single summary message
+MAX_HISTORY_MESSAGES = 20
+KEEP_RECENT_MESSAGES = 10
+HISTORY_TOKEN_BUDGET = 8000
+
+# Tool results whose messages fit in this many characters are summarized locally
+SHORT_RESULT_MESSAGE_CHARS = 200
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """Get the tiktoken encoding for a model, falling back to cl100k_base"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Estimate token count, using tiktoken when installed"""
+    if tiktoken is None or not model:
+        return len(text) // 4
+    return len(_get_encoding(model).encode(text))
+
+
+_CODE_FENCE_RE = re.compile(r"```(?:json)?", re.IGNORECASE)
+
+
+def _extract_json_array(text: str) -> Optional[str]:
+    """Return the slice from the first '[' to its matching ']', skipping brackets inside strings"""
+    start = text.find("[")
+    if start < 0:
+        return None
+    
+    depth = 0
+    quote = None
+    escaped = False
+    for idx in range(start, len(text)):
+        char = text[idx]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return text[start:idx + 1]
+    return None
+
+
+def _parse_plan(content: str) -> Optional[Any]:
+    """Parse a planner reply tolerantly: surrounding prose, code fences and Python-style quotes"""
+    for candidate in (content, _CODE_FENCE_RE.sub("", content)):
+        snippet = _extract_json_array(candidate)
+        if snippet is None:
+            continue
+        try:
+            return orjson.loads(snippet) if orjson else json.loads(snippet)
+        except ValueError:
+            pass
+        try:
+            # The planning prompt itself shows single-quoted keys, which models often copy
+            return ast.literal_eval(snippet)
+        except (ValueError, SyntaxError):
+            pass
+    return None
+
+
+_TOOLS_BY_EXT: Dict[str, Tuple[str, ...]] = {
+    ".pptx": ("search_pptx_text", "replace_pptx_text", "analyze_pptx_structure", "get_pptx_slide_info"),
+    ".docx": ("search_docx_text", "replace_docx_text", "analyze_docx_structure"),
+    ".xlsx": ("search_excel_text", "replace_excel_text", "find_replace_excel_text", "analyze_excel_structure", "get_excel_range"),
+}
+
+_JSON_SCHEMA_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+def _compile_args_validator(parameters: Dict[str, Any]) -> Callable[[Any], None]:
+    """Compile a validator for a tool's parameter schema; it raises ValueError on invalid arguments"""
+    # Tools are called with **args, so unknown arguments are as fatal as missing ones
+    parameters = {**parameters, "additionalProperties": False}
+    
+    if fastjsonschema is not None:
+        validate = fastjsonschema.compile(parameters)
+        
+        def validator(args: Any) -> None:
+            try:
+                validate(args)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(e.message) from e
+        
+        return validator
+    
+    # Minimal fallback covering what tool schemas use: required, property types and enums
+    properties = parameters.get("properties", {})
+    required = parameters.get("required", [])
+    
+    def validator(args: Any) -> None:
+        if not isinstance(args, dict):
+            raise ValueError("arguments must be an object")
+        missing = [name for name in required if name not in args]
+        if missing:
+            raise ValueError(f"missing required argument(s): {', '.join(missing)}")
+        for name, value in args.items():
+            spec = properties.get(name)
+            if spec is None:
+                raise ValueError(f"unexpected argument '{name}'")
+            expected = _JSON_SCHEMA_TYPES.get(spec.get("type"))
+            if expected and (not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool)):
+                raise ValueError(f"argument '{name}' must be of type {spec['type']}")
+            if "enum" in spec and value not in spec["enum"]:
+                raise ValueError(f"argument '{name}' must be one of {spec['enum']}")
+    
+    return validator
+
+
+def _check_tool_signature(tool: Any, parameters: Dict[str, Any]) -> None:
+    """Raise ValueError unless the schema's required arguments are exactly the call's required parameters"""
+    # The registry prefers the synchronous fast path, so check whichever it will call
+    call = getattr(tool, "_execute_sync", None) or tool.execute
+    params = inspect.signature(call).parameters.values()
+    if any(param.kind is param.VAR_KEYWORD for param in params):
+        return
+    accepted = {param.name for param in params}
+    needed = {param.name for param in params if param.default is param.empty}
+    required = set(parameters.get("required", []))
+    unknown = set(parameters.get("properties", {})) - accepted
+    if required != needed or unknown:
+        raise ValueError(
+            f"Schema of tool '{tool.name}' does not match its execute signature: "
+            f"schema requires {sorted(required)}, execute requires {sorted(needed)}"
+            + (f", execute does not accept {sorted(unknown)}" if unknown else "")
+        )
+
 
 class ReactTranslationAgent:
     """React Agent for translation editing using LLM with specialized tools"""
@@ -23,7 +195,12 @@ class ReactTranslationAgent:
         self.system_prompt = system_prompt or "You are a helpful translation editing assistant."
         self.tool_registry = ToolRegistry()
         self.current_session = None
+        self._session_content_ref: Optional[SessionContentRef] = None
+        self._schemas_by_filetype: Dict[str, List[Dict[str, Any]]] = {}
+        self._planner_tool_info: Dict[Tuple[str, ...], str] = {}
+        self._arg_validators: Dict[str, Callable[[Any], None]] = {}
         self.conversation_history = []
+        self._history_tokens = 0
         # Register tools
         self._register_tools()
     
@@ -44,40 +221,52 @@ class ReactTranslationAgent:
         # Excel tools
         self.tool_registry.register(ExcelSearchTool())
         self.tool_registry.register(ExcelReplaceTool())
+        self.tool_registry.register(ExcelFindReplaceTool())
         self.tool_registry.register(ExcelAnalyzeTool())
         self.tool_registry.register(ExcelGetRangeTool())
         
-        logger.info(f"Registered {len(self.tool_registry.list_tools())} tools")
+        # Compile argument validators once so planned calls are checked before dispatch
+        for tool_name in self.tool_registry.list_tools():
+            parameters = self.tool_registry.get_schema(tool_name).get("parameters", {})
+            _check_tool_signature(self.tool_registry.get_tool(tool_name), parameters)
+            self._arg_validators[tool_name] = _compile_args_validator(parameters)
+        
+        logger.info("Registered %d tools", len(self.tool_registry.list_tools()))
     
     def set_session_context(self, session_data: Dict[str, Any]):
         """Set current session context for the agent"""
+        # Add session context to conversation; normalize the extension once so
+        # every later tool lookup is a plain dict hit (on a copy: the caller's dict is left as is)
+        file_type = (session_data.get("file_type") or "").lower()
+        session_data = {**session_data, "file_type": file_type}
         self.current_session = session_data
         self.conversation_history = []
-        
-        # Add session context to conversation
-        file_type = session_data.get("file_type", "")
+        self._history_tokens = 0
         file_name = session_data.get("file_name", "")
         
         # Update tools with session content
         self._update_tools_with_session_content(session_data)
         
+        # Warm the planner's tool summary so the first message doesn't pay for it
+        self._get_planner_tool_info(self._get_tools_for_file_type(file_type))
+        
         system_message = self._create_system_message(file_type, file_name)
-        self.conversation_history.append({
-            "role": "system",
-            "content": system_message
-        })
+        self._append_history("system", system_message)
         
-        logger.info(f"Set session context for {file_name} ({file_type})")
+        logger.info("Set session context for %s (%s)", file_name, file_type)
     
     def _update_tools_with_session_content(self, session_data: Dict[str, Any]):
         """Update tools with current session content"""
         session_content = session_data.get("translated_content", {})
         
-        # Update all tools that have set_session_content method
+        # The agent owns the only strong reference; tools reach the content
+        # through the registry, so replacing the ref lets the previous
+        # session's content be collected right away.
+        self._session_content_ref = SessionContentRef(session_content)
+        self.tool_registry.set_session_content(self._session_content_ref)
         for tool_name, tool in self.tool_registry.tools.items():
-            if hasattr(tool, 'set_session_content'):
-                tool.set_session_content(session_content)
-                logger.debug(f"Updated {tool_name} with session content")
+            if tool.supports_session_content:
+                logger.debug("Updated %s with session content", tool_name)
     
     def _create_system_message(self, file_type: str, file_name: str) -> str:
         """Create system message based on file type"""
@@ -110,26 +299,32 @@ Current session: {file_name} ({file_type})
         
         return base_message
     
-    def _get_tools_for_file_type(self, file_type: str) -> List[str]:
+    def _get_tools_for_file_type(self, file_type: str) -> Tuple[str, ...]:
         """Get available tools for specific file type"""
-        
-        if file_type == ".pptx":
-            return ["search_pptx_text", "replace_pptx_text", "analyze_pptx_structure", "get_pptx_slide_info"]
-        elif file_type == ".docx":
-            return ["search_docx_text", "replace_docx_text", "analyze_docx_structure"]
-        elif file_type == ".xlsx":
-            return ["search_excel_text", "replace_excel_text", "analyze_excel_structure", "get_excel_range"]
-        else:
-            return []
+        return _TOOLS_BY_EXT.get(file_type, ())
     
-    async def plan_tool_sequence(self, message: str, available_tools: List[str], provider: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Use LLM to plan a sequence of tool calls based on user message, with tool descriptions"""
-        provider = provider or self.default_provider
+    def _get_tool_schemas(self, file_type: str) -> List[Dict[str, Any]]:
+        """Get OpenAI tool schemas for a file type, cached per file type"""
+        schemas = self._schemas_by_filetype.get(file_type)
+        if schemas is None:
+            schemas = self._schemas_by_filetype[file_type] = [
+                {"type": "function", "function": self.tool_registry.get_schema(tool_name)}
+                for tool_name in self._get_tools_for_file_type(file_type)
+            ]
+        return schemas
+    
+    def _get_planner_tool_info(self, available_tools: Sequence[str]) -> str:
+        """Get the planner's JSON summary of the available tools, serialized once per tool set"""
+        key = tuple(available_tools)
+        tool_info_json = self._planner_tool_info.get(key)
+        if tool_info_json is not None:
+            return tool_info_json
+        
         # Build tool info with description and parameter schema
         tool_info = []
-        for tool_name in available_tools:
+        for tool_name in key:
             tool_obj = self.tool_registry.get_tool(tool_name)
-            schema = tool_obj.get_schema() if hasattr(tool_obj, "get_schema") else {}
+            schema = self.tool_registry.get_schema(tool_name)
             param_info = []
             parameters = schema.get("parameters", {})
             properties = parameters.get("properties", {})
@@ -143,40 +338,50 @@ Current session: {file_name} ({file_type})
                 })
             tool_info.append({
                 "tool": tool_name,
-                "description": getattr(tool_obj, "description", "No description available"),
+                "description": tool_obj.description,
                 "parameters": param_info
             })
+        if orjson:
+            tool_info_json = orjson.dumps(tool_info).decode("utf-8")
+        else:
+            tool_info_json = json.dumps(tool_info, ensure_ascii=False)
+        self._planner_tool_info[key] = tool_info_json
+        return tool_info_json
+    
+    async def plan_tool_sequence(self, message: str, available_tools: Sequence[str], provider: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Use LLM to plan a sequence of tool calls based on user message, with tool descriptions"""
+        provider = provider or self.default_provider
+        tool_info_json = self._get_planner_tool_info(available_tools)
         planning_prompt = (
             f"You are an expert translation agent. Given the user request: '{message}', "
-            f"and the available tools (with descriptions and parameter requirements): {json.dumps(tool_info, ensure_ascii=False)}, "
+            f"and the available tools (with descriptions and parameter requirements): {tool_info_json}, "
             "please plan a step-by-step sequence of tool calls (with arguments) to fulfill the request. "
             "For each tool call, provide all required parameters. "
             "Return a list of tool call plans in JSON format: [{'tool': ..., 'args': {{...}}}]. "
             "If no tool is needed, return an empty list."
         )
-        logger.info(planning_prompt)
+        if logger.isEnabledFor(TRACE):
+            logger.log(TRACE, "Planning prompt: %s", planning_prompt)
         planning_messages = [
             {"role": "system", "content": planning_prompt},
             {"role": "user", "content": message}
         ]
-        logger.info("Planning tool sequence using LLM...")
-        logger.info(provider)
+        logger.info("Planning tool sequence using LLM provider %s", provider)
         planning_response = await self.llm_manager.chat_completion(
             provider_name=provider,
             messages=planning_messages
         )
-        logger.info(planning_response)
+        logger.debug("Planning response: %s", planning_response)
         if not planning_response.get("success"):
-            logger.error(f"Planning LLM error: {planning_response.get('error')}")
+            logger.error("Planning LLM error: %s", planning_response.get("error"))
             return []
-        plan_content = planning_response["message"].content
-        try:
-            plan = json.loads(plan_content)
-            logger.info(f"LLM planning result: {plan}")
-            return plan if isinstance(plan, list) else []
-        except Exception as e:
-            logger.error(f"Error parsing planning result: {e}")
+        plan_content = planning_response["message"].content or ""
+        plan = _parse_plan(plan_content)
+        if plan is None:
+            logger.error("Error parsing planning result: %r", plan_content)
             return []
+        logger.debug("LLM planning result: %s", plan)
+        return plan if isinstance(plan, list) else []
 
     async def process_message(self, message: str, provider: Optional[str] = None) -> Dict[str, Any]:
         """Process user message using planning and React pattern"""
@@ -187,54 +392,75 @@ Current session: {file_name} ({file_type})
                 "content_updated": False
             }
         provider = provider or self.default_provider
-        self.conversation_history.append({
-            "role": "user",
-            "content": message
-        })
+        self._append_history("user", message)
         file_type = self.current_session.get("file_type", "")
         available_tools = self._get_tools_for_file_type(file_type)
-        tool_schemas = [
-            {"type": "function", "function": self.tool_registry.get_tool(tool_name).get_schema()}
-            for tool_name in available_tools
-        ]
-        logger.info(f"Received user message: {message}")
+        tool_schemas = self._get_tool_schemas(file_type)
+        logger.info("Received user message: %s", message)
         # Step 1: Planning
         plan = await self.plan_tool_sequence(message, available_tools, provider)
-        logger.info(f"Planned tool sequence: {plan}")
+        logger.info("Planned %d tool call(s)", len(plan))
         tool_results = []
+        executed_tools = []
         content_updated = False
         # Step 2: Execute planned tools
         for step in plan:
             tool_name = step.get("tool")
             tool_args = step.get("args", {})
             if tool_name in available_tools:
-                logger.info(f"Executing planned tool: {tool_name} with args: {tool_args}")
+                try:
+                    self._arg_validators[tool_name](tool_args)
+                except ValueError as e:
+                    logger.warning("Skipping planned tool %s, invalid args %s: %s", tool_name, tool_args, e)
+                    tool_results.append({
+                        "success": False,
+                        "error": f"Invalid arguments for {tool_name}: {e}"
+                    })
+                    executed_tools.append(tool_name)
+                    continue
+                logger.info("Executing planned tool: %s", tool_name)
+                logger.debug("Args for %s: %s", tool_name, tool_args)
                 result = await self.tool_registry.execute_tool(tool_name, **tool_args)
                 tool_results.append(result)
+                executed_tools.append(tool_name)
                 if result.get("success") and "updated_content" in result:
                     self.current_session["translated_content"] = result["updated_content"]
+                    if result["updated_content"] is not self._session_content_ref.content:
+                        # New content object: start a fresh ref so derived caches are rebuilt
+                        self._session_content_ref = SessionContentRef(result["updated_content"])
+                        self.tool_registry.set_session_content(self._session_content_ref)
                     content_updated = True
             else:
-                logger.warning(f"Planned tool {tool_name} not in available tools.")
+                logger.warning("Planned tool %s not in available tools.", tool_name)
         # Step 3: Final LLM response
-        self.conversation_history.append({
-            "role": "assistant",
-            "content": f"Planned tool sequence executed. Results: {json.dumps(tool_results)}"
-        })
-        # Optionally, you can call LLM again to summarize or explain the result
-        summary_prompt = (
-            "Summarize the results of the tool executions for the user in a helpful way. "
-            "If content was updated, mention it."
-        )
-        summary_messages = self.conversation_history + [
-            {"role": "system", "content": summary_prompt}
-        ]
-        summary_response = await self.llm_manager.chat_completion(
-            provider_name=provider,
-            messages=summary_messages
-        )
-        final_response = summary_response["message"].content if summary_response.get("success") else "Tool sequence executed."
-        logger.info(f"Final assistant response: {final_response}")
+        self._append_history("assistant", f"Planned tool sequence executed. Results: {json.dumps(tool_results)}")
+        if not plan:
+            final_response = "No action was needed."
+        elif tool_results and all(
+            result.get("success") and len(result.get("message", "")) <= SHORT_RESULT_MESSAGE_CHARS
+            for result in tool_results
+        ):
+            # Simple successful results are described locally, saving an LLM round-trip
+            final_response = "\n".join(
+                self.tool_registry.get_tool(tool_name).format_result(result)
+                for tool_name, result in zip(executed_tools, tool_results)
+            )
+        else:
+            # Failures or complex results: ask the LLM to summarize or explain
+            summary_prompt = (
+                "Summarize the results of the tool executions for the user in a helpful way. "
+                "If content was updated, mention it."
+            )
+            summary_messages = self.conversation_history + [
+                {"role": "system", "content": summary_prompt}
+            ]
+            summary_response = await self.llm_manager.chat_completion(
+                provider_name=provider,
+                messages=summary_messages
+            )
+            final_response = summary_response["message"].content if summary_response.get("success") else "Tool sequence executed."
+        logger.debug("Final assistant response: %s", final_response)
+        await self._compact_history(provider)
         return {
             "success": True,
             "response": final_response,
@@ -243,6 +469,53 @@ Current session: {file_name} ({file_type})
             "updated_content": self.current_session.get("translated_content") if content_updated else None
         }
     
+    def _provider_model(self, provider: str) -> Optional[str]:
+        """Model name of an LLM provider, if known"""
+        llm_provider = self.llm_manager.providers.get(provider)
+        return getattr(llm_provider, "model", None)
+    
+    def _append_history(self, role: str, content: str):
+        """Append a message to the history and update the running token estimate"""
+        self.conversation_history.append({"role": role, "content": content})
+        self._history_tokens += _estimate_tokens(content, self._provider_model(self.default_provider))
+    
+    async def _compact_history(self, provider: str):
+        """Fold older turns into one summary message once the history exceeds its budget"""
+        history = self.conversation_history
+        if len(history) <= MAX_HISTORY_MESSAGES and self._history_tokens <= HISTORY_TOKEN_BUDGET:
+            return
+        
+        # Keep the session system message and the most recent turns verbatim
+        head = history[:1] if history and history[0]["role"] == "system" else []
+        older = history[len(head):-KEEP_RECENT_MESSAGES]
+        recent = history[-KEEP_RECENT_MESSAGES:]
+        if not older:
+            return
+        
+        transcript = "\n".join(f"{msg['role']}: {msg['content']}" for msg in older)
+        summary_response = await self.llm_manager.chat_completion(
+            provider_name=provider,
+            messages=[
+                {"role": "system", "content": "Summarize this conversation between a user and a translation editing assistant. Keep requested edits, applied changes and open questions. Be concise."},
+                {"role": "user", "content": transcript}
+            ]
+        )
+        
+        compacted = list(head)
+        if summary_response.get("success"):
+            compacted.append({
+                "role": "system",
+                "content": f"Previous context summary: {summary_response['message'].content}"
+            })
+        else:
+            logger.warning("History summarization failed, dropping older turns: %s", summary_response.get("error"))
+        compacted.extend(recent)
+        
+        model = self._provider_model(self.default_provider)
+        self.conversation_history = compacted
+        self._history_tokens = sum(_estimate_tokens(msg["content"], model) for msg in compacted)
+        logger.info("Compacted conversation history from %d to %d messages", len(history), len(compacted))
+    
     def get_conversation_history(self) -> list:
         """Return the current conversation history."""
         return self.conversation_history
@@ -259,7 +532,7 @@ Current session: {file_name} ({file_type})
             "file_type": self.current_session.get("file_type"),
             "source_lang": self.current_session.get("source_lang"),
             "target_lang": self.current_session.get("target_lang"),
-            "available_tools": self._get_tools_for_file_type(self.current_session.get("file_type", "")),
+            "available_tools": list(self._get_tools_for_file_type(self.current_session.get("file_type", ""))),
             "conversation_length": len([msg for msg in self.conversation_history if msg["role"] in ["user", "assistant"]]),
             "llm_provider": self.default_provider
         }
@@ -272,9 +545,9 @@ Current session: {file_name} ({file_type})
             file_name = self.current_session.get("file_name", "")
             system_message = self._create_system_message(file_type, file_name)
             
-            self.conversation_history = [{
-                "role": "system",
-                "content": system_message
-            }]
+            self.conversation_history = []
+            self._history_tokens = 0
+            self._append_history("system", system_message)
         else:
             self.conversation_history = []
+            self._history_tokens = 0
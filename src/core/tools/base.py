@@ -4,28 +4,72 @@ Base tools for React Agent
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
-from abc import ABC, abstractmethod
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
 
-class BaseTool(ABC):
+class SessionContentRef:
+    """Holder for the active session content shared by all tools"""
+    
+    def __init__(self, content: Dict[str, Any]):
+        self.content = content
+        # Derived lookup structures (e.g. lowercased texts) built lazily by tools
+        self.cache: Dict[str, Any] = {}
+
+
+class Tool(Protocol):
+    """Interface every React Agent tool provides (for type checkers)"""
+    
+    name: str
+    description: str
+    supports_session_content: bool
+    
+    async def execute(self, **kwargs) -> Dict[str, Any]: ...
+    
+    def get_schema(self) -> Dict[str, Any]: ...
+    
+    def format_result(self, result: Dict[str, Any]) -> str: ...
+
+
+class BaseTool:
     """Base class for React Agent tools"""
     
+    __slots__ = ("name", "description", "_registry")
+    
+    # Tools that read the active session content from the registry set this to True
+    supports_session_content: bool = False
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
+        self._registry: Optional["ToolRegistry"] = None
+    
+    @property
+    def session_ref(self) -> Optional[SessionContentRef]:
+        """Active session reference, resolved through the owning registry"""
+        if self._registry is None:
+            return None
+        return self._registry.active_session
+    
+    @property
+    def session_content(self) -> Optional[Dict[str, Any]]:
+        """Active session content, resolved through the owning registry"""
+        if self._registry is None:
+            return None
+        return self._registry.active_session_content
     
-    @abstractmethod
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the tool"""
-        pass
+        raise NotImplementedError
+    
+    # CPU-only tools may also define `_execute_sync(**kwargs)`; the registry calls it
+    # directly, and `execute` stays a thin async adapter over it
     
-    @abstractmethod
     def get_schema(self) -> Dict[str, Any]:
         """Get OpenAI function calling schema"""
-        pass
+        raise NotImplementedError
     
     def format_result(self, result: Dict[str, Any]) -> str:
         """Format tool result for LLM"""
@@ -40,24 +84,55 @@ class ToolRegistry:
     
     def __init__(self):
         self.tools: Dict[str, BaseTool] = {}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        # (callable, is_sync) per tool, resolved once at registration
+        self._runners: Dict[str, Tuple[Callable[..., Any], bool]] = {}
+        self._session_ref: Optional[weakref.ref] = None
     
     def register(self, tool: BaseTool):
         """Register a tool"""
+        tool._registry = self
         self.tools[tool.name] = tool
+        self._schemas.pop(tool.name, None)
+        # Tools with a synchronous fast path skip the coroutine round-trip
+        execute_sync = getattr(tool, "_execute_sync", None)
+        self._runners[tool.name] = (execute_sync, True) if execute_sync is not None else (tool.execute, False)
         logger.info(f"Registered tool: {tool.name}")
     
+    def set_session_content(self, ref: Optional[SessionContentRef]):
+        """Point all tools at the given session content (held weakly)"""
+        self._session_ref = weakref.ref(ref) if ref is not None else None
+    
+    @property
+    def active_session(self) -> Optional[SessionContentRef]:
+        """Reference to the active session, or None once the owner drops it"""
+        return self._session_ref() if self._session_ref is not None else None
+    
+    @property
+    def active_session_content(self) -> Optional[Dict[str, Any]]:
+        """Content of the active session, or None once the owner drops it"""
+        ref = self.active_session
+        return ref.content if ref is not None else None
+    
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get tool by name"""
         return self.tools.get(name)
     
+    def get_schema(self, name: str) -> Dict[str, Any]:
+        """Get a tool's schema, built once and cached (schemas are static)"""
+        schema = self._schemas.get(name)
+        if schema is None:
+            schema = self._schemas[name] = self.tools[name].get_schema()
+        return schema
+    
     def get_schemas(self) -> List[Dict[str, Any]]:
         """Get all tool schemas for OpenAI function calling"""
         return [
             {
                 "type": "function",
-                "function": tool.get_schema()
+                "function": self.get_schema(name)
             }
-            for tool in self.tools.values()
+            for name in self.tools
         ]
     
     def list_tools(self) -> List[str]:
@@ -66,15 +141,18 @@ class ToolRegistry:
     
     async def execute_tool(self, name: str, **kwargs) -> Dict[str, Any]:
         """Execute a tool by name"""
-        tool = self.get_tool(name)
-        if not tool:
+        runner = self._runners.get(name)
+        if runner is None:
             return {
                 "success": False,
                 "error": f"Tool '{name}' not found"
             }
         
         try:
-            return await tool.execute(**kwargs)
+            run, is_sync = runner
+            if is_sync:
+                return run(**kwargs)
+            return await run(**kwargs)
         except Exception as e:
             logger.error(f"Error executing tool {name}: {e}")
             return {
@@ -4,26 +4,82 @@ Specialized tools for DOCX editing
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from core.tools.base import BaseTool
+import numpy as np
+
+from core.tools.base import BaseTool, SessionContentRef
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _DocxFragment:
+    """A text-bearing node of the DOCX content with its location and cached text"""
+    section: str
+    fields: Dict[str, Any]
+    location: str
+    node: Dict[str, Any]
+    text: str
+    text_lower: str
+    
+    def set_text(self, text: str) -> None:
+        """Write new text to the content node and keep the cached copies in sync"""
+        self.node["text"] = self.text = text
+        self.text_lower = text.lower()
+
+
+def _fragment(section: str, fields: Dict[str, Any], location: str, node: Dict[str, Any]) -> _DocxFragment:
+    text = node.get("text", "")
+    return _DocxFragment(section, fields, location, node, text, text.lower())
+
+
+def _build_fragment_index(content: Dict[str, Any]) -> List[_DocxFragment]:
+    """Flatten DOCX content into fragments in document order"""
+    fragments = []
+    
+    for para_idx, paragraph in enumerate(content.get("paragraphs", [])):
+        fragments.append(_fragment("paragraph", {"type": "paragraph", "index": para_idx}, f"Paragraph {para_idx + 1}", paragraph))
+    
+    for table_idx, table in enumerate(content.get("tables", [])):
+        for row_idx, row in enumerate(table.get("rows", [])):
+            for cell_idx, cell in enumerate(row.get("cells", [])):
+                fragments.append(_fragment(
+                    "table",
+                    {"type": "table_cell", "table_index": table_idx, "row_index": row_idx, "cell_index": cell_idx},
+                    f"Table {table_idx + 1}, Row {row_idx + 1}, Cell {cell_idx + 1}",
+                    cell
+                ))
+    
+    for header_idx, header in enumerate(content.get("headers", [])):
+        fragments.append(_fragment("header", {"type": "header", "index": header_idx}, f"Header {header_idx + 1}", header))
+    
+    for footer_idx, footer in enumerate(content.get("footers", [])):
+        fragments.append(_fragment("footer", {"type": "footer", "index": footer_idx}, f"Footer {footer_idx + 1}", footer))
+    
+    return fragments
+
+
+def _session_fragment_index(ref: SessionContentRef) -> List[_DocxFragment]:
+    """Get the fragment index for the session, building it once per session"""
+    fragments = ref.cache.get("docx_fragments")
+    if fragments is None:
+        fragments = ref.cache["docx_fragments"] = _build_fragment_index(ref.content)
+    return fragments
+
+
 class DOCXSearchTool(BaseTool):
     """Tool to search text in DOCX content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="search_docx_text",
             description="Search for specific text in Word document"
         )
-        self.session_content = None
-    
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
     
     async def execute(self, search_term: str) -> Dict[str, Any]:
         """Search for text in DOCX content"""
@@ -34,60 +90,12 @@ class DOCXSearchTool(BaseTool):
                     "error": "No session content available"
                 }
             
-            content = self.session_content
-            results = []
-            
-            # Search in paragraphs
-            if "paragraphs" in content:
-                for para_idx, paragraph in enumerate(content["paragraphs"]):
-                    text = paragraph.get("text", "")
-                    if search_term.lower() in text.lower():
-                        results.append({
-                            "type": "paragraph",
-                            "index": para_idx,
-                            "text": text,
-                            "location": f"Paragraph {para_idx + 1}"
-                        })
-            
-            # Search in tables
-            if "tables" in content:
-                for table_idx, table in enumerate(content["tables"]):
-                    for row_idx, row in enumerate(table.get("rows", [])):
-                        for cell_idx, cell in enumerate(row.get("cells", [])):
-                            text = cell.get("text", "")
-                            if search_term.lower() in text.lower():
-                                results.append({
-                                    "type": "table_cell",
-                                    "table_index": table_idx,
-                                    "row_index": row_idx,
-                                    "cell_index": cell_idx,
-                                    "text": text,
-                                    "location": f"Table {table_idx + 1}, Row {row_idx + 1}, Cell {cell_idx + 1}"
-                                })
-            
-            # Search in headers
-            if "headers" in content:
-                for header_idx, header in enumerate(content["headers"]):
-                    text = header.get("text", "")
-                    if search_term.lower() in text.lower():
-                        results.append({
-                            "type": "header",
-                            "index": header_idx,
-                            "text": text,
-                            "location": f"Header {header_idx + 1}"
-                        })
-            
-            # Search in footers
-            if "footers" in content:
-                for footer_idx, footer in enumerate(content["footers"]):
-                    text = footer.get("text", "")
-                    if search_term.lower() in text.lower():
-                        results.append({
-                            "type": "footer",
-                            "index": footer_idx,
-                            "text": text,
-                            "location": f"Footer {footer_idx + 1}"
-                        })
+            search_term_lower = search_term.lower()
+            results = [
+                {**fragment.fields, "text": fragment.text, "location": fragment.location}
+                for fragment in _session_fragment_index(self.session_ref)
+                if search_term_lower in fragment.text_lower
+            ]
             
             return {
                 "success": True,
@@ -109,16 +117,12 @@ class DOCXSearchTool(BaseTool):
             "parameters": {
                 "type": "object",
                 "properties": {
-                    "content": {
-                        "type": "object",
-                        "description": "DOCX content structure"
-                    },
                     "search_term": {
                         "type": "string",
                         "description": "Text to search for"
                     }
                 },
-                "required": ["content", "search_term"]
+                "required": ["search_term"]
             }
         }
 
@@ -126,6 +130,9 @@ class DOCXSearchTool(BaseTool):
 class DOCXReplaceTool(BaseTool):
     """Tool to replace text in DOCX content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="replace_docx_text",
@@ -137,74 +144,34 @@ class DOCXReplaceTool(BaseTool):
         try:
             replacements = []
             
-            # Replace in paragraphs
-            if "paragraphs" in content and (not location_type or location_type == "paragraph"):
-                for para_idx, paragraph in enumerate(content["paragraphs"]):
-                    if old_text in paragraph.get("text", ""):
-                        old_full_text = paragraph["text"]
-                        paragraph["text"] = old_full_text.replace(old_text, new_text)
-                        
-                        # Also update runs if they exist
-                        for run in paragraph.get("runs", []):
-                            if old_text in run.get("text", ""):
-                                run["text"] = run["text"].replace(old_text, new_text)
-                        
-                        replacements.append({
-                            "type": "paragraph",
-                            "index": para_idx,
-                            "old_text": old_full_text,
-                            "new_text": paragraph["text"],
-                            "location": f"Paragraph {para_idx + 1}"
-                        })
-            
-            # Replace in tables
-            if "tables" in content and (not location_type or location_type == "table"):
-                for table_idx, table in enumerate(content["tables"]):
-                    for row_idx, row in enumerate(table.get("rows", [])):
-                        for cell_idx, cell in enumerate(row.get("cells", [])):
-                            if old_text in cell.get("text", ""):
-                                old_cell_text = cell["text"]
-                                cell["text"] = old_cell_text.replace(old_text, new_text)
-                                
-                                replacements.append({
-                                    "type": "table_cell",
-                                    "table_index": table_idx,
-                                    "row_index": row_idx,
-                                    "cell_index": cell_idx,
-                                    "old_text": old_cell_text,
-                                    "new_text": cell["text"],
-                                    "location": f"Table {table_idx + 1}, Row {row_idx + 1}, Cell {cell_idx + 1}"
-                                })
+            # Reuse (and keep in sync) the session's index when editing session content
+            ref = self.session_ref
+            if ref is not None and content is ref.content:
+                fragments = _session_fragment_index(ref)
+            else:
+                fragments = _build_fragment_index(content)
             
-            # Replace in headers
-            if "headers" in content and (not location_type or location_type == "header"):
-                for header_idx, header in enumerate(content["headers"]):
-                    if old_text in header.get("text", ""):
-                        old_header_text = header["text"]
-                        header["text"] = old_header_text.replace(old_text, new_text)
-                        
-                        replacements.append({
-                            "type": "header",
-                            "index": header_idx,
-                            "old_text": old_header_text,
-                            "new_text": header["text"],
-                            "location": f"Header {header_idx + 1}"
-                        })
-            
-            # Replace in footers
-            if "footers" in content and (not location_type or location_type == "footer"):
-                for footer_idx, footer in enumerate(content["footers"]):
-                    if old_text in footer.get("text", ""):
-                        old_footer_text = footer["text"]
-                        footer["text"] = old_footer_text.replace(old_text, new_text)
-                        
-                        replacements.append({
-                            "type": "footer",
-                            "index": footer_idx,
-                            "old_text": old_footer_text,
-                            "new_text": footer["text"],
-                            "location": f"Footer {footer_idx + 1}"
-                        })
+            for fragment in fragments:
+                if location_type and fragment.section != location_type:
+                    continue
+                if old_text not in fragment.text:
+                    continue
+                
+                old_fragment_text = fragment.text
+                fragment.set_text(old_fragment_text.replace(old_text, new_text))
+                
+                # Also update paragraph runs if they exist
+                if fragment.section == "paragraph":
+                    for run in fragment.node.get("runs", []):
+                        if old_text in run.get("text", ""):
+                            run["text"] = run["text"].replace(old_text, new_text)
+                
+                replacements.append({
+                    **fragment.fields,
+                    "old_text": old_fragment_text,
+                    "new_text": fragment.text,
+                    "location": fragment.location
+                })
             
             return {
                 "success": True,
@@ -253,6 +220,8 @@ class DOCXReplaceTool(BaseTool):
 class DOCXAnalyzeTool(BaseTool):
     """Tool to analyze DOCX structure and content"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="analyze_docx_structure",
@@ -270,18 +239,24 @@ class DOCXAnalyzeTool(BaseTool):
                 "content_overview": {}
             }
             
+            # Per-paragraph counts in one pass over the texts
+            texts = [paragraph.get("text", "") for paragraph in content.get("paragraphs", [])]
+            char_counts = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+            word_counts = np.fromiter(
+                (len(text.split()) for text in texts), dtype=np.int64, count=len(texts)
+            )
+            
             # Analyze paragraphs
             if "paragraphs" in content:
-                para_analysis = []
-                for para_idx, paragraph in enumerate(content["paragraphs"]):
-                    text = paragraph.get("text", "")
-                    para_analysis.append({
+                analysis["content_overview"]["paragraphs"] = [
+                    {
                         "index": para_idx,
-                        "char_count": len(text),
-                        "word_count": len(text.split()) if text else 0,
-                        "preview": text[:100] + "..." if len(text) > 100 else text
-                    })
-                analysis["content_overview"]["paragraphs"] = para_analysis
+                        "char_count": int(char_count),
+                        "word_count": int(word_count),
+                        "preview": text[:100] + "..." if char_count > 100 else text
+                    }
+                    for para_idx, (text, char_count, word_count) in enumerate(zip(texts, char_counts, word_counts))
+                ]
             
             # Analyze tables
             if "tables" in content:
@@ -297,13 +272,8 @@ class DOCXAnalyzeTool(BaseTool):
                 analysis["content_overview"]["tables"] = table_analysis
             
             # Calculate totals
-            total_words = 0
-            total_chars = 0
-            
-            for para in content.get("paragraphs", []):
-                text = para.get("text", "")
-                total_words += len(text.split()) if text else 0
-                total_chars += len(text)
+            total_words = int(word_counts.sum())
+            total_chars = int(char_counts.sum())
             
             analysis["summary"] = {
                 "total_words": total_words,
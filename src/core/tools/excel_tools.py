@@ -4,28 +4,343 @@ Specialized tools for Excel/XLSX editing
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+from bisect import bisect_right
+from itertools import accumulate, islice
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from core.tools.base import BaseTool
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+from core.tools.base import BaseTool, SessionContentRef
 
 logger = logging.getLogger(__name__)
 
+# Column letters by 0-based index, extended on demand
+_COL_CACHE: List[str] = []
+
+
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _num_to_excel_col(col_num: int) -> str:
+    """Convert column number to Excel column letter"""
+    # Unrolled for one to three letters, which covers Excel's last column (XFD)
+    if col_num < 26:
+        return _LETTERS[col_num]
+    if col_num < 702:
+        high, low = divmod(col_num - 26, 26)
+        return _LETTERS[high] + _LETTERS[low]
+    if col_num < 18278:
+        rest, low = divmod(col_num - 702, 26)
+        high, mid = divmod(rest, 26)
+        return _LETTERS[high] + _LETTERS[mid] + _LETTERS[low]
+    
+    parts = []
+    while col_num >= 0:
+        col_num, remainder = divmod(col_num, 26)
+        parts.append(_LETTERS[remainder])
+        col_num -= 1
+    return "".join(reversed(parts))
+
+
+def _ensure_col_cache(n: int) -> List[str]:
+    """Make sure letters for the first n columns are cached and return the cache"""
+    for col_num in range(len(_COL_CACHE), n):
+        _COL_CACHE.append(_num_to_excel_col(col_num))
+    return _COL_CACHE
+
+
+def _as_str(value: Any) -> str:
+    """Cell value as text, without a str() round-trip for values that already are strings"""
+    if type(value) is str:
+        return value
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _replacement_dicts(replaced: List[tuple]) -> List[Dict[str, Any]]:
+    """Materialize (sheet_idx, sheet_name, row_idx, col_idx, address, old, new, location_prefix) tuples"""
+    return [
+        {
+            "sheet_index": sheet_idx,
+            "sheet_name": sheet_name,
+            "row_index": row_idx,
+            "col_index": col_idx,
+            "cell_address": cell_address,
+            "old_value": old_value,
+            "new_value": new_value,
+            "location": location_prefix + cell_address
+        }
+        for sheet_idx, sheet_name, row_idx, col_idx, cell_address, old_value, new_value, location_prefix in replaced
+    ]
+
+
+def _compile_multi_replacer(patterns: List[str], replacement: str) -> Callable[[str], str]:
+    """Build a single-pass replacer for several patterns (leftmost, longest match wins).
+    
+    The returned function gives back the input object itself when nothing matched.
+    """
+    patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, len(pattern))
+        automaton.make_automaton()
+        
+        def replace(text: str) -> str:
+            matches = sorted((end - length + 1, -length) for end, length in automaton.iter(text))
+            if not matches:
+                return text
+            parts = []
+            pos = 0
+            for start, neg_length in matches:
+                if start < pos:
+                    continue
+                parts.append(text[pos:start])
+                parts.append(replacement)
+                pos = start - neg_length
+            parts.append(text[pos:])
+            return "".join(parts)
+        
+        return replace
+    
+    # Longest first so the alternation prefers longer patterns at the same position
+    regex = re.compile("|".join(map(re.escape, sorted(patterns, key=len, reverse=True))))
+    
+    def replace(text: str) -> str:
+        new_text, count = regex.subn(lambda _match: replacement, text)
+        return new_text if count else text
+    
+    return replace
+
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _classify_ascii(buf, offsets, truthy):
+        """Count (non-empty, number, decimal) cells over ASCII values packed into one byte buffer"""
+        n_non_empty = 0
+        n_number = 0
+        n_decimal = 0
+        for i in numba.prange(truthy.shape[0]):
+            if not truthy[i]:
+                continue
+            blank = True
+            digits = 0
+            dots = 0
+            others = 0
+            for j in range(offsets[i], offsets[i + 1]):
+                c = buf[j]
+                if 48 <= c <= 57:
+                    digits += 1
+                    blank = False
+                elif c == 46:
+                    dots += 1
+                    blank = False
+                else:
+                    others += 1
+                    # Same whitespace set as str.strip() within ASCII
+                    if not (c == 32 or 9 <= c <= 13 or 28 <= c <= 31):
+                        blank = False
+            if blank:
+                continue
+            n_non_empty += 1
+            if others == 0 and digits > 0:
+                if dots == 0:
+                    n_number += 1
+                else:
+                    n_decimal += 1
+        return n_non_empty, n_number, n_decimal
+else:
+    _classify_ascii = None
+
+
+def _data_type_counts(non_empty: int, number: int, decimal: int) -> Dict[str, int]:
+    counts = {"number": number, "decimal": decimal, "text": non_empty - number - decimal}
+    return {data_type: count for data_type, count in counts.items() if count}
+
+
+def _count_data_types(values: List[Any]) -> Tuple[int, Dict[str, int]]:
+    """Count non-empty cells and classify them as number/decimal/text, vectorized over the sheet"""
+    if not values:
+        return 0, {}
+    
+    value_strs = list(map(_as_str, values))
+    
+    # Compiled kernel over one packed byte buffer when numba is installed and the sheet is ASCII
+    if _classify_ascii is not None and all(map(str.isascii, value_strs)):
+        truthy = np.fromiter(map(bool, values), dtype=bool, count=len(values))
+        buf = np.frombuffer("".join(value_strs).encode("ascii"), dtype=np.uint8)
+        offsets = np.zeros(len(value_strs) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, value_strs), dtype=np.int64, count=len(value_strs)), out=offsets[1:])
+        non_empty, number, decimal = _classify_ascii(buf, offsets, truthy)
+        return int(non_empty), _data_type_counts(int(non_empty), int(number), int(decimal))
+    
+    # Plain loop otherwise: a fixed-width numpy string array would be sized by the longest cell
+    non_empty = number = decimal = 0
+    for value, text in zip(values, value_strs):
+        if not value or not text.strip():
+            continue
+        non_empty += 1
+        if text.isdigit():
+            number += 1
+        elif "." in text and text.replace(".", "").isdigit():
+            decimal += 1
+    return non_empty, _data_type_counts(non_empty, number, decimal)
+
+
+def _find_sheet(content: Dict[str, Any], sheet_name: str, ref: Optional[SessionContentRef]) -> Optional[Tuple[int, Dict[str, Any]]]:
+    """Look up (index, sheet) by name; the name index is built once per session content"""
+    is_session = ref is not None and content is ref.content
+    index = ref.cache.get("excel_sheets_by_name") if is_session else None
+    if index is None:
+        index = {}
+        for sheet_idx, sheet in enumerate(content["sheets"]):
+            index.setdefault(sheet.get("name", f"Sheet{sheet_idx + 1}"), (sheet_idx, sheet))
+        if is_session:
+            ref.cache["excel_sheets_by_name"] = index
+    return index.get(sheet_name)
+
+
+def _select_sheets(content: Dict[str, Any], sheet_name: Optional[str], ref: Optional[SessionContentRef]) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+    """(index, sheet) pairs to visit: all sheets, or just the named one (None if it doesn't exist)"""
+    if not sheet_name:
+        return list(enumerate(content["sheets"]))
+    found = _find_sheet(content, sheet_name, ref)
+    return [found] if found is not None else None
+
+
+def _walk_sheets(sheet_entries: List[Tuple[int, Dict[str, Any]]]) -> Iterator[Tuple[int, str, List[list], List[str], List[str], str]]:
+    """Yield (sheet_idx, sheet_name, rows, col_letters, row_labels, location_prefix) per sheet.
+    
+    Shared by the search and replace tools so addressing is precomputed once per sheet;
+    a cell address is then col_letters[col_idx] + row_labels[row_idx].
+    """
+    for sheet_idx, sheet in sheet_entries:
+        sheet_name = sheet.get("name", f"Sheet{sheet_idx + 1}")
+        rows = sheet.get("cells", [])
+        yield (
+            sheet_idx,
+            sheet_name,
+            rows,
+            _ensure_col_cache(max(map(len, rows), default=0)),
+            list(map(str, range(1, len(rows) + 1))),
+            f"Sheet '{sheet_name}', Cell "
+        )
+
+
+def _flat_cell_values(rows: List[list]) -> List[str]:
+    """Cell values of a sheet as strings, flattened row by row"""
+    return [_as_str(cell["value"]) if "value" in cell else "" for row in rows for cell in row]
+
+
+def _hit_coordinates(rows: List[list], hits: np.ndarray) -> Tuple[List[int], List[int]]:
+    """Map flat cell indices back to (row indices, column indices)"""
+    row_lengths = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+    row_starts = np.cumsum(row_lengths) - row_lengths
+    hit_rows = np.searchsorted(row_starts, hits, side="right") - 1
+    hit_cols = hits - row_starts[hit_rows]
+    return hit_rows.tolist(), hit_cols.tolist()
+
+
+_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+
+
+def _first_hit_per_value(find: Callable[[int], int], starts: List[int]) -> np.ndarray:
+    """Indices of values with a match in their NUL-joined buffer, given find(pos) -> match offset or -1"""
+    last = len(starts) - 2
+    hits = []
+    pos = find(0)
+    while pos != -1:
+        value_idx = bisect_right(starts, pos) - 1
+        hits.append(value_idx)
+        if value_idx == last:
+            break
+        # One hit per cell: resume at the next cell
+        pos = find(starts[value_idx + 1])
+    return np.array(hits, dtype=np.int64)
+
+
+def _build_search_fn(search_term: str) -> Callable[[List[str]], np.ndarray]:
+    """Specialize the case-insensitive sheet matcher for one search term.
+    
+    The returned function maps a sheet's flattened values to the flat indices of matching
+    cells. Everything that only depends on the term (casefolding, encoding, picking the
+    strategy, compiling the regex) is settled here once per search, not once per sheet.
+    """
+    needle = search_term.casefold()
+    
+    if "\0" in needle:
+        # A NUL in the needle could match across cells of a joined buffer; check cell by cell
+        def search(values: List[str]) -> np.ndarray:
+            return np.array(
+                [idx for idx, value in enumerate(values) if needle in value.casefold()], dtype=np.int64
+            )
+        
+        return search
+    
+    if not needle.isascii():
+        # Casefolding can change lengths, so the buffer and its offsets come from the folded values
+        def search(values: List[str]) -> np.ndarray:
+            folded = [value.casefold() for value in values]
+            starts = list(accumulate(map(len, folded), lambda offset, length: offset + length + 1, initial=0))
+            haystack = "\0".join(folded)
+            return _first_hit_per_value(lambda pos: haystack.find(needle, pos), starts)
+        
+        return search
+    
+    # Values are joined into one NUL-separated buffer and scanned once; a NUL-free
+    # needle cannot match across cells, and hits are mapped back via value offsets
+    needle_bytes = needle.encode("ascii")
+    pattern = re.compile(re.escape(needle), re.IGNORECASE)
+    
+    def search(values: List[str]) -> np.ndarray:
+        starts = list(accumulate(map(len, values), lambda offset, length: offset + length + 1, initial=0))
+        
+        if all(map(str.isascii, values)):
+            # ASCII sheets (the common case): one bytes.translate lowers everything,
+            # which for ASCII equals casefolding, then bytes.find scans it
+            haystack = "\0".join(values).encode("ascii").translate(_ASCII_LOWER)
+            return _first_hit_per_value(lambda pos: haystack.find(needle_bytes, pos), starts)
+        
+        # ASCII needle over mixed text: a compiled case-insensitive regex avoids a casefolded
+        # copy per cell (multi-character folds such as "ß" -> "ss" are not applied here)
+        text = "\0".join(values)
+        
+        def find(pos: int) -> int:
+            match = pattern.search(text, pos)
+            return match.start() if match else -1
+        
+        return _first_hit_per_value(find, starts)
+    
+    return search
+
 
 class ExcelSearchTool(BaseTool):
     """Tool to search text in Excel content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="search_excel_text",
             description="Search for specific text in Excel spreadsheet"
         )
-        self.session_content = None
     
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
-    
-    async def execute(self, search_term: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+    async def execute(self, search_term: str, sheet_name: Optional[str] = None, max_results: Optional[int] = None) -> Dict[str, Any]:
         """Search for text in Excel content"""
         try:
             if not self.session_content:
@@ -35,7 +350,6 @@ class ExcelSearchTool(BaseTool):
                 }
             
             content = self.session_content
-            results = []
             
             if "sheets" not in content:
                 return {
@@ -43,35 +357,29 @@ class ExcelSearchTool(BaseTool):
                     "error": "Invalid Excel content structure"
                 }
             
-            sheets_to_search = content["sheets"]
-            if sheet_name:
-                sheets_to_search = [sheet for sheet in content["sheets"] if sheet.get("name") == sheet_name]
-                if not sheets_to_search:
-                    return {
-                        "success": False,
-                        "error": f"Sheet '{sheet_name}' not found"
-                    }
+            sheet_entries = _select_sheets(content, sheet_name, self.session_ref)
+            if sheet_entries is None:
+                return {
+                    "success": False,
+                    "error": f"Sheet '{sheet_name}' not found"
+                }
             
-            for sheet_idx, sheet in enumerate(sheets_to_search):
-                sheet_name_actual = sheet.get("name", f"Sheet{sheet_idx + 1}")
-                
-                for row_idx, row in enumerate(sheet.get("cells", [])):
-                    for col_idx, cell in enumerate(row):
-                        cell_value = str(cell.get("value", ""))
-                        
-                        if search_term.lower() in cell_value.lower():
-                            # Convert column index to Excel column letter
-                            col_letter = self._num_to_excel_col(col_idx)
-                            
-                            results.append({
-                                "sheet_index": sheet_idx,
-                                "sheet_name": sheet_name_actual,
-                                "row_index": row_idx,
-                                "col_index": col_idx,
-                                "cell_address": f"{col_letter}{row_idx + 1}",
-                                "value": cell_value,
-                                "location": f"Sheet '{sheet_name}', Cell {col_letter}{row_idx + 1}"
-                            })
+            # Materialize lazily from the match stream; max_results bounds memory on huge hit sets
+            matches = self._iter_matches(sheet_entries, _build_search_fn(search_term))
+            if max_results is not None:
+                matches = islice(matches, max_results)
+            results = [
+                {
+                    "sheet_index": sheet_idx,
+                    "sheet_name": sheet_name_actual,
+                    "row_index": row_idx,
+                    "col_index": col_idx,
+                    "cell_address": cell_address,
+                    "value": cell_value,
+                    "location": location
+                }
+                for sheet_idx, sheet_name_actual, row_idx, col_idx, cell_address, cell_value, location in matches
+            ]
             
             return {
                 "success": True,
@@ -86,15 +394,34 @@ class ExcelSearchTool(BaseTool):
                 "error": f"Search failed: {str(e)}"
             }
     
-    def _num_to_excel_col(self, col_num: int) -> str:
-        """Convert column number to Excel column letter"""
-        result = ""
-        while col_num >= 0:
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num = col_num // 26 - 1
-            if col_num < 0:
-                break
-        return result
+    def _iter_matches(self, sheet_entries: List[Tuple[int, Dict[str, Any]]], search: Callable[[List[str]], np.ndarray]) -> Iterator[tuple]:
+        """Yield (sheet_idx, sheet_name, row_idx, col_idx, cell_address, value, location) per matching cell"""
+        # Sheets are scanned one at a time, so a caller that stops early never scans the rest
+        for sheet_view in _walk_sheets(sheet_entries):
+            yield from self._scan_sheet(sheet_view, search)
+    
+    def _scan_sheet(self, sheet_view: tuple, search: Callable[[List[str]], np.ndarray]) -> List[tuple]:
+        """Match tuples for one sheet view from _walk_sheets"""
+        sheet_idx, sheet_name_actual, rows, col_letters, row_labels, location_prefix = sheet_view
+        
+        # Scan the whole sheet in one vectorized pass over the flattened cells,
+        # then map flat hit positions back to (row, column)
+        cell_values = _flat_cell_values(rows)
+        if not cell_values:
+            return []
+        hits = search(cell_values)
+        if not hits.size:
+            return []
+        
+        hit_rows, hit_cols = _hit_coordinates(rows, hits)
+        matches = []
+        for flat_idx, row_idx, col_idx in zip(hits.tolist(), hit_rows, hit_cols):
+            cell_address = col_letters[col_idx] + row_labels[row_idx]
+            matches.append((
+                sheet_idx, sheet_name_actual, row_idx, col_idx,
+                cell_address, cell_values[flat_idx], location_prefix + cell_address
+            ))
+        return matches
     
     def get_schema(self) -> Dict[str, Any]:
         return {
@@ -110,6 +437,10 @@ class ExcelSearchTool(BaseTool):
                     "sheet_name": {
                         "type": "string",
                         "description": "Optional: specific sheet name to search in, if not provided searches all sheets"
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Optional: stop after this many matches"
                     }
                 },
                 "required": ["search_term"]
@@ -120,13 +451,15 @@ class ExcelSearchTool(BaseTool):
 class ExcelReplaceTool(BaseTool):
     """Tool to replace text in Excel content"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="replace_excel_text",
             description="Replace specific text in Excel spreadsheet"
         )
     
-    async def execute(self, content: Dict[str, Any], old_text: str, new_text: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+    async def execute(self, content: Dict[str, Any], old_text: str, new_text: str, sheet_name: Optional[str] = None, old_texts: Optional[List[str]] = None) -> Dict[str, Any]:
         """Replace text in Excel content"""
         try:
             if "sheets" not in content:
@@ -135,36 +468,34 @@ class ExcelReplaceTool(BaseTool):
                     "error": "Invalid Excel content structure"
                 }
             
-            replacements = []
+            # str.replace hands back the same object when nothing matched, so one call
+            # both finds and replaces; several patterns are handled in a single pass
+            if old_texts:
+                replace = _compile_multi_replacer([old_text, *old_texts], new_text)
+            else:
+                replace = methodcaller("replace", old_text, new_text)
             
-            for sheet_idx, sheet in enumerate(content["sheets"]):
-                current_sheet_name = sheet.get("name", f"Sheet{sheet_idx + 1}")
-                
-                # Skip if specific sheet requested and this isn't it
-                if sheet_name and current_sheet_name != sheet_name:
-                    continue
-                
-                for row_idx, row in enumerate(sheet.get("cells", [])):
+            # Compact tuples during the scan; result dicts are built once at the end
+            replaced = []
+            
+            # Only touch the requested sheet when one is given
+            sheet_entries = _select_sheets(content, sheet_name, self.session_ref) or []
+            
+            for sheet_idx, current_sheet_name, rows, col_letters, row_labels, location_prefix in _walk_sheets(sheet_entries):
+                for row_idx, row in enumerate(rows):
                     for col_idx, cell in enumerate(row):
-                        cell_value = str(cell.get("value", ""))
+                        cell_value = _as_str(cell["value"]) if "value" in cell else ""
+                        new_value = replace(cell_value)
+                        if new_value is cell_value:
+                            continue
                         
-                        if old_text in cell_value:
-                            old_value = cell_value
-                            new_value = cell_value.replace(old_text, new_text)
-                            cell["value"] = new_value
-                            
-                            col_letter = self._num_to_excel_col(col_idx)
-                            
-                            replacements.append({
-                                "sheet_index": sheet_idx,
-                                "sheet_name": current_sheet_name,
-                                "row_index": row_idx,
-                                "col_index": col_idx,
-                                "cell_address": f"{col_letter}{row_idx + 1}",
-                                "old_value": old_value,
-                                "new_value": new_value,
-                                "location": f"Sheet '{current_sheet_name}', Cell {col_letter}{row_idx + 1}"
-                            })
+                        cell["value"] = new_value
+                        replaced.append((
+                            sheet_idx, current_sheet_name, row_idx, col_idx,
+                            col_letters[col_idx] + row_labels[row_idx], cell_value, new_value, location_prefix
+                        ))
+            
+            replacements = _replacement_dicts(replaced)
             
             return {
                 "success": True,
@@ -180,16 +511,6 @@ class ExcelReplaceTool(BaseTool):
                 "error": f"Replacement failed: {str(e)}"
             }
     
-    def _num_to_excel_col(self, col_num: int) -> str:
-        """Convert column number to Excel column letter"""
-        result = ""
-        while col_num >= 0:
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num = col_num // 26 - 1
-            if col_num < 0:
-                break
-        return result
-    
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -212,6 +533,11 @@ class ExcelReplaceTool(BaseTool):
                     "sheet_name": {
                         "type": "string",
                         "description": "Specific sheet name to replace in (optional)"
+                    },
+                    "old_texts": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Optional: more texts to replace with new_text in the same pass"
                     }
                 },
                 "required": ["content", "old_text", "new_text"]
@@ -219,9 +545,116 @@ class ExcelReplaceTool(BaseTool):
         }
 
 
+class ExcelFindReplaceTool(BaseTool):
+    """Tool to find and replace text in Excel content in a single pass"""
+    
+    __slots__ = ()
+    supports_session_content = True
+    
+    def __init__(self):
+        super().__init__(
+            name="find_replace_excel_text",
+            description="Find text (case-insensitive) in Excel spreadsheet and replace every occurrence in one pass"
+        )
+    
+    async def execute(self, search_term: str, new_text: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+        """Find and replace text in the session's Excel content"""
+        try:
+            if not self.session_content:
+                return {
+                    "success": False,
+                    "error": "No session content available"
+                }
+            
+            content = self.session_content
+            
+            if "sheets" not in content:
+                return {
+                    "success": False,
+                    "error": "Invalid Excel content structure"
+                }
+            
+            sheet_entries = _select_sheets(content, sheet_name, self.session_ref)
+            if sheet_entries is None:
+                return {
+                    "success": False,
+                    "error": f"Sheet '{sheet_name}' not found"
+                }
+            
+            search = _build_search_fn(search_term)
+            pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+            # Compact tuples during the scan; result dicts are built once at the end
+            replaced = []
+            
+            # Matching cells are found with the vectorized search scan and rewritten
+            # in the same walk, so the sheet is traversed once for both steps
+            for sheet_idx, current_sheet_name, rows, col_letters, row_labels, location_prefix in _walk_sheets(sheet_entries):
+                cell_values = _flat_cell_values(rows)
+                if not cell_values:
+                    continue
+                hits = search(cell_values)
+                if not hits.size:
+                    continue
+                
+                hit_rows, hit_cols = _hit_coordinates(rows, hits)
+                for flat_idx, row_idx, col_idx in zip(hits.tolist(), hit_rows, hit_cols):
+                    old_value = cell_values[flat_idx]
+                    new_value, count = pattern.subn(lambda _match: new_text, old_value)
+                    if not count:
+                        continue
+                    
+                    rows[row_idx][col_idx]["value"] = new_value
+                    replaced.append((
+                        sheet_idx, current_sheet_name, row_idx, col_idx,
+                        col_letters[col_idx] + row_labels[row_idx], old_value, new_value, location_prefix
+                    ))
+            
+            replacements = _replacement_dicts(replaced)
+            
+            return {
+                "success": True,
+                "replacements": replacements,
+                "count": len(replacements),
+                "updated_content": content,
+                "message": f"Found and replaced '{search_term}' with '{new_text}' in {len(replacements)} cells"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Find and replace failed: {str(e)}"
+            }
+    
+    def get_schema(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "search_term": {
+                        "type": "string",
+                        "description": "Text to find (case-insensitive)"
+                    },
+                    "new_text": {
+                        "type": "string",
+                        "description": "Replacement text"
+                    },
+                    "sheet_name": {
+                        "type": "string",
+                        "description": "Optional: specific sheet name to replace in, if not provided replaces in all sheets"
+                    }
+                },
+                "required": ["search_term", "new_text"]
+            }
+        }
+
+
 class ExcelAnalyzeTool(BaseTool):
     """Tool to analyze Excel structure and content"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="analyze_excel_structure",
@@ -245,36 +678,7 @@ class ExcelAnalyzeTool(BaseTool):
             total_cells = 0
             total_non_empty_cells = 0
             
-            for sheet_idx, sheet in enumerate(content["sheets"]):
-                sheet_name = sheet.get("name", f"Sheet{sheet_idx + 1}")
-                rows = sheet.get("cells", [])
-                
-                sheet_info = {
-                    "sheet_index": sheet_idx,
-                    "sheet_name": sheet_name,
-                    "rows_count": len(rows),
-                    "columns_count": max(len(row) for row in rows) if rows else 0,
-                    "total_cells": sum(len(row) for row in rows),
-                    "non_empty_cells": 0,
-                    "data_types": {}
-                }
-                
-                # Analyze cell contents
-                for row in rows:
-                    for cell in row:
-                        value = cell.get("value", "")
-                        if value and str(value).strip():
-                            sheet_info["non_empty_cells"] += 1
-                            
-                            # Basic data type detection
-                            value_str = str(value)
-                            if value_str.isdigit():
-                                sheet_info["data_types"]["number"] = sheet_info["data_types"].get("number", 0) + 1
-                            elif "." in value_str and value_str.replace(".", "").isdigit():
-                                sheet_info["data_types"]["decimal"] = sheet_info["data_types"].get("decimal", 0) + 1
-                            else:
-                                sheet_info["data_types"]["text"] = sheet_info["data_types"].get("text", 0) + 1
-                
+            for sheet_info in map(self._analyze_sheet, enumerate(content["sheets"])):
                 total_cells += sheet_info["total_cells"]
                 total_non_empty_cells += sheet_info["non_empty_cells"]
                 
@@ -300,6 +704,32 @@ class ExcelAnalyzeTool(BaseTool):
                 "error": f"Analysis failed: {str(e)}"
             }
     
+    def _analyze_sheet(self, sheet_entry: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """Structure and data type overview of one sheet"""
+        sheet_idx, sheet = sheet_entry
+        sheet_name = sheet.get("name", f"Sheet{sheet_idx + 1}")
+        rows = sheet.get("cells", [])
+        
+        # One walk over the rows gathers the shape and the values to classify
+        max_cols = 0
+        values = []
+        for row in rows:
+            if len(row) > max_cols:
+                max_cols = len(row)
+            values.extend([cell["value"] if "value" in cell else "" for cell in row])
+        
+        non_empty, data_types = _count_data_types(values)
+        
+        return {
+            "sheet_index": sheet_idx,
+            "sheet_name": sheet_name,
+            "rows_count": len(rows),
+            "columns_count": max_cols,
+            "total_cells": len(values),
+            "non_empty_cells": non_empty,
+            "data_types": data_types
+        }
+    
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -320,13 +750,18 @@ class ExcelAnalyzeTool(BaseTool):
 class ExcelGetRangeTool(BaseTool):
     """Tool to get content from specific range in Excel"""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="get_excel_range",
-            description="Get content from specific range in Excel spreadsheet"
+            description=(
+                "Get content from specific range in Excel spreadsheet; returns range_data "
+                "(cells with row/col/address/value), or just a 2-D values grid with mode='values'"
+            )
         )
     
-    async def execute(self, content: Dict[str, Any], sheet_name: str, start_row: int, end_row: int, start_col: int, end_col: int) -> Dict[str, Any]:
+    async def execute(self, content: Dict[str, Any], sheet_name: str, start_row: int, end_row: int, start_col: int, end_col: int, mode: str = "full") -> Dict[str, Any]:
         """Get content from Excel range"""
         try:
             if "sheets" not in content:
@@ -336,63 +771,56 @@ class ExcelGetRangeTool(BaseTool):
                 }
             
             # Find the sheet
-            target_sheet = None
-            for sheet in content["sheets"]:
-                if sheet.get("name") == sheet_name:
-                    target_sheet = sheet
-                    break
-            
-            if not target_sheet:
+            found = _find_sheet(content, sheet_name, self.session_ref)
+            if found is None:
                 return {
                     "success": False,
                     "error": f"Sheet '{sheet_name}' not found"
                 }
             
-            range_data = []
-            rows = target_sheet.get("cells", [])
-            
-            for row_idx in range(start_row, min(end_row + 1, len(rows))):
-                row_data = []
-                row = rows[row_idx]
-                
-                for col_idx in range(start_col, min(end_col + 1, len(row))):
-                    cell = row[col_idx] if col_idx < len(row) else {}
-                    row_data.append({
-                        "row": row_idx,
-                        "col": col_idx,
-                        "address": f"{self._num_to_excel_col(col_idx)}{row_idx + 1}",
-                        "value": cell.get("value", "")
-                    })
-                
-                range_data.append(row_data)
-            
-            start_addr = f"{self._num_to_excel_col(start_col)}{start_row + 1}"
-            end_addr = f"{self._num_to_excel_col(end_col)}{end_row + 1}"
+            rows = found[1].get("cells", [])
+            col_letters = _ensure_col_cache(max(start_col, end_col) + 1)
+            start_addr = f"{col_letters[start_col]}{start_row + 1}"
+            end_addr = f"{col_letters[end_col]}{end_row + 1}"
+            row_slice = rows[start_row:end_row + 1]
             
-            return {
+            result = {
                 "success": True,
-                "range_data": range_data,
                 "range_address": f"{start_addr}:{end_addr}",
                 "sheet_name": sheet_name,
                 "message": f"Retrieved range {start_addr}:{end_addr} from sheet '{sheet_name}'"
             }
             
+            # "values" returns a plain 2-D grid instead of range_data; addresses follow from range_address
+            if mode == "values":
+                result["values"] = [
+                    [cell["value"] if "value" in cell else "" for cell in row[start_col:end_col + 1]]
+                    for row in row_slice
+                ]
+                return result
+            
+            range_data = []
+            for row_idx, row in enumerate(row_slice, start_row):
+                row_label = str(row_idx + 1)
+                range_data.append([
+                    {
+                        "row": row_idx,
+                        "col": col_idx,
+                        "address": col_letters[col_idx] + row_label,
+                        "value": cell["value"] if "value" in cell else ""
+                    }
+                    for col_idx, cell in enumerate(row[start_col:end_col + 1], start_col)
+                ])
+            
+            result["range_data"] = range_data
+            return result
+            
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Failed to get range: {str(e)}"
             }
     
-    def _num_to_excel_col(self, col_num: int) -> str:
-        """Convert column number to Excel column letter"""
-        result = ""
-        while col_num >= 0:
-            result = chr(col_num % 26 + ord('A')) + result
-            col_num = col_num // 26 - 1
-            if col_num < 0:
-                break
-        return result
-    
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -423,6 +851,11 @@ class ExcelGetRangeTool(BaseTool):
                     "end_col": {
                         "type": "integer",
                         "description": "End column index (0-based)"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["values", "full"],
+                        "description": "Optional: 'full' (default) returns range_data with row/col/address/value per cell; 'values' returns only a 2-D list of values, which is smaller for large ranges"
                     }
                 },
                 "required": ["content", "sheet_name", "start_row", "end_row", "start_col", "end_col"]
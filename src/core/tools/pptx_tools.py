@@ -4,29 +4,244 @@ Specialized tools for PPTX editing
 import re
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
 
-from core.tools.base import BaseTool
+from core.tools.base import BaseTool, SessionContentRef
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _compile_ci_pattern(text: str) -> re.Pattern:
+    """Compiled case-insensitive literal pattern, reused across replace calls"""
+    return re.compile(re.escape(text), re.IGNORECASE)
+
+
+def _frame_text(text_frame: Dict[str, Any]) -> str:
+    """Current text of a frame: the edited/translated "text", falling back to older keys"""
+    if "text" in text_frame:
+        return text_frame["text"]
+    return text_frame.get("translated_text", text_frame.get("original_text", ""))
+
+
+def _fold_text(text: str) -> Tuple[str, Optional[bytes]]:
+    """Casefolded text plus, for ASCII text, its lowercased bytes for bytes.find"""
+    return text.casefold(), text.lower().encode("ascii") if text.isascii() else None
+
+
+class _FlatDeck:
+    """Structure-of-arrays view of every PPTX text frame, built once per session.
+    
+    Position i in the parallel lists describes one frame in slide/shape/frame order;
+    nodes[i] is the frame dict itself so edits reach the content. Frames of slide s
+    occupy positions slide_starts[s] to slide_starts[s + 1].
+    """
+    
+    __slots__ = (
+        "slide_idx", "shape_idx", "frame_idx", "nodes",
+        "text", "text_folded", "text_ascii", "char_count", "slide_starts"
+    )
+    
+    def __init__(self, content: Dict[str, Any]):
+        self.slide_idx: List[int] = []
+        self.shape_idx: List[int] = []
+        self.frame_idx: List[int] = []
+        self.nodes: List[Dict[str, Any]] = []
+        self.text: List[str] = []
+        self.text_folded: List[str] = []
+        # Lowercased ASCII bytes of each text, or None when it isn't pure ASCII
+        self.text_ascii: List[Optional[bytes]] = []
+        self.char_count: List[int] = []
+        self.slide_starts: List[int] = [0]
+        
+        for slide_idx, slide in enumerate(content.get("slides", [])):
+            for shape_idx, shape in enumerate(slide.get("shapes", [])):
+                for frame_idx, text_frame in enumerate(shape.get("text_frames", [])):
+                    text = _frame_text(text_frame)
+                    folded, ascii_bytes = _fold_text(text)
+                    self.slide_idx.append(slide_idx)
+                    self.shape_idx.append(shape_idx)
+                    self.frame_idx.append(frame_idx)
+                    self.nodes.append(text_frame)
+                    self.text.append(text)
+                    self.text_folded.append(folded)
+                    self.text_ascii.append(ascii_bytes)
+                    self.char_count.append(len(text))
+            self.slide_starts.append(len(self.nodes))
+    
+    def __len__(self) -> int:
+        return len(self.nodes)
+    
+    def slide_range(self, slide_idx: int) -> range:
+        """Positions of one slide's frames (empty for an unknown slide)"""
+        if not 0 <= slide_idx < len(self.slide_starts) - 1:
+            return range(0)
+        return range(self.slide_starts[slide_idx], self.slide_starts[slide_idx + 1])
+    
+    def location(self, position: int) -> str:
+        return f"Slide {self.slide_idx[position] + 1}, Shape {self.shape_idx[position] + 1}, Frame {self.frame_idx[position] + 1}"
+    
+    def set_text(self, position: int, text: str) -> None:
+        """Write new text to a frame and keep the cached columns in sync"""
+        self.nodes[position]["text"] = self.text[position] = text
+        self.text_folded[position], self.text_ascii[position] = _fold_text(text)
+        self.char_count[position] = len(text)
+
+
+def _session_deck(ref: SessionContentRef) -> _FlatDeck:
+    """Get the flat frame view for the session, building it once per session"""
+    deck = ref.cache.get("pptx_deck")
+    if deck is None:
+        deck = ref.cache["pptx_deck"] = _FlatDeck(ref.content)
+    return deck
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _session_token_index(ref: SessionContentRef) -> Dict[str, List[int]]:
+    """Inverted index of casefolded word tokens -> positions in the session's flat deck"""
+    index = ref.cache.get("pptx_tokens")
+    if index is None:
+        postings = defaultdict(list)
+        for position, folded in enumerate(_session_deck(ref).text_folded):
+            for token in dict.fromkeys(_TOKEN_RE.findall(folded)):
+                postings[token].append(position)
+        index = ref.cache["pptx_tokens"] = dict(postings)
+    return index
+
+
+def _candidate_frames(ref: SessionContentRef, needle: str, whole_word: bool) -> Optional[List[int]]:
+    """Frame positions that can contain the needle, or None when every frame has to be scanned.
+    
+    In whole-word mode every query token must be a token of the frame. For substring
+    queries only tokens with a non-word character on both sides inside the query are
+    guaranteed to appear as whole tokens in a matching frame.
+    """
+    spans = [match.span() for match in _TOKEN_RE.finditer(needle)]
+    if not whole_word:
+        spans = [(start, end) for start, end in spans if start > 0 and end < len(needle)]
+    if not spans:
+        return None
+    
+    index = _session_token_index(ref)
+    candidates = None
+    for start, end in spans:
+        positions = index.get(needle[start:end], ())
+        candidates = set(positions) if candidates is None else candidates.intersection(positions)
+        if not candidates:
+            return []
+    return sorted(candidates)
+
+
+def _scan_frames(
+    text_folded: List[str],
+    text_ascii: List[Optional[bytes]],
+    positions: Sequence[int],
+    needle: str,
+    needle_ascii: Optional[bytes],
+    word_pattern: Optional[Pattern[str]]
+) -> List[int]:
+    """Positions whose folded frame text contains the needle"""
+    hits = []
+    for position in positions:
+        if word_pattern is not None:
+            found = word_pattern.search(text_folded[position]) is not None
+        elif needle_ascii is not None and text_ascii[position] is not None:
+            found = text_ascii[position].find(needle_ascii) != -1
+        else:
+            found = needle in text_folded[position]
+        if found:
+            hits.append(position)
+    return hits
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class _KeywordTrie:
+    """Case-insensitive whole-word keyword trie for batch replacement (FlashText-style).
+    
+    Each text is scanned once, character by character, whatever the number of keywords;
+    at every word start the longest keyword that ends on a word boundary wins.
+    """
+    
+    __slots__ = ("_root",)
+    
+    _KEYWORD = "_keyword_"
+    
+    def __init__(self, keywords: Dict[str, str]):
+        self._root: Dict[str, Any] = {}
+        for keyword, replacement in keywords.items():
+            if not keyword:
+                continue
+            node = self._root
+            for ch in keyword.lower():
+                node = node.setdefault(ch, {})
+            node[self._KEYWORD] = replacement
+    
+    def replace(self, text: str) -> Tuple[str, int]:
+        """Replace all keywords in text, returning (new_text, replacement_count)"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # A few characters lowercase to several; fold per character to keep positions aligned
+            lowered = "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+        
+        parts = []
+        count = 0
+        last = 0
+        i = 0
+        n = len(text)
+        while i < n:
+            node = self._root
+            j = i
+            match_end = -1
+            match_replacement = None
+            while j < n and lowered[j] in node:
+                node = node[lowered[j]]
+                j += 1
+                if self._KEYWORD in node and (j == n or not _is_word_char(text[j])):
+                    match_end = j
+                    match_replacement = node[self._KEYWORD]
+            
+            if match_end != -1:
+                parts.append(text[last:i])
+                parts.append(match_replacement)
+                count += 1
+                last = i = match_end
+            elif _is_word_char(text[i]):
+                # Keywords only start at word starts: skip the rest of this word
+                while i < n and _is_word_char(text[i]):
+                    i += 1
+            else:
+                i += 1
+        
+        if not count:
+            return text, 0
+        parts.append(text[last:])
+        return "".join(parts), count
+
+
 class PPTXSearchTool(BaseTool):
     """Tool to search text in PPTX content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="search_pptx_text",
             description="Search for specific text in PowerPoint slides"
         )
-        self.session_content = None
     
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
-    
-    async def execute(self, search_term: str, slide_idx: Optional[int] = None) -> Dict[str, Any]:
+    async def execute(self, search_term: str, slide_idx: Optional[int] = None, whole_word: bool = False) -> Dict[str, Any]:
         """Search for text in PPTX content"""
+        return self._execute_sync(search_term, slide_idx, whole_word)
+    
+    def _execute_sync(self, search_term: str, slide_idx: Optional[int] = None, whole_word: bool = False) -> Dict[str, Any]:
         try:
             if not self.session_content:
                 return {
@@ -35,7 +250,6 @@ class PPTXSearchTool(BaseTool):
                 }
             
             content = self.session_content
-            results = []
             
             if "slides" not in content:
                 return {
@@ -43,31 +257,48 @@ class PPTXSearchTool(BaseTool):
                     "error": "Invalid PPTX content structure"
                 }
             
-            slides_to_search = [content["slides"][slide_idx]] if slide_idx is not None else content["slides"]
-            start_idx = slide_idx if slide_idx is not None else 0
+            slides = content["slides"]
+            if slide_idx is not None:
+                slide_idx = range(len(slides))[slide_idx]
             
-            for slide_offset, slide in enumerate(slides_to_search):
-                slide_idx_actual = start_idx + slide_offset
-                slide_results = []
-                
-                for shape_idx, shape in enumerate(slide.get("shapes", [])):
-                    for frame_idx, text_frame in enumerate(shape.get("text_frames", [])):
-                        text = text_frame.get("translated_text", text_frame.get("original_text", ""))
-                        
-                        if search_term.lower() in text.lower():
-                            slide_results.append({
-                                "shape_idx": shape_idx,
-                                "frame_idx": frame_idx,
-                                "text": text,
-                                "location": f"Slide {slide_idx_actual + 1}, Shape {shape_idx + 1}, Frame {frame_idx + 1}"
-                            })
-                
-                if slide_results:
-                    results.append({
-                        "slide_idx": slide_idx_actual,
-                        "slide_title": slide.get("title", f"Slide {slide_idx_actual + 1}"),
-                        "matches": slide_results
-                    })
+            # Frames come pre-folded from the session index, so a query is one substring test
+            # per frame; ASCII needles against ASCII frames use bytes.find
+            needle = search_term.casefold()
+            needle_ascii = needle.encode("ascii") if needle.isascii() else None
+            deck = _session_deck(self.session_ref)
+            
+            # The token index narrows the frames to test; a single-word whole-word query
+            # is answered by its posting list alone
+            candidates = _candidate_frames(self.session_ref, needle, whole_word)
+            single_token = whole_word and _TOKEN_RE.fullmatch(needle) is not None
+            word_pattern = re.compile(r"(?<!\w)" + re.escape(needle) + r"(?!\w)") if whole_word and not single_token else None
+            
+            if candidates is None:
+                positions = deck.slide_range(slide_idx) if slide_idx is not None else range(len(deck))
+            elif slide_idx is not None:
+                positions = [position for position in candidates if deck.slide_idx[position] == slide_idx]
+            else:
+                positions = candidates
+            
+            # Every candidate of a single-token whole-word query is already a hit
+            hits = positions if single_token else _scan_frames(deck.text_folded, deck.text_ascii, positions, needle, needle_ascii, word_pattern)
+            matches_by_slide: Dict[int, List[Dict[str, Any]]] = {}
+            for position in hits:
+                matches_by_slide.setdefault(deck.slide_idx[position], []).append({
+                    "shape_idx": deck.shape_idx[position],
+                    "frame_idx": deck.frame_idx[position],
+                    "text": deck.text[position],
+                    "location": deck.location(position)
+                })
+            
+            results = [
+                {
+                    "slide_idx": match_slide_idx,
+                    "slide_title": slides[match_slide_idx].get("title", f"Slide {match_slide_idx + 1}"),
+                    "matches": slide_matches
+                }
+                for match_slide_idx, slide_matches in matches_by_slide.items()
+            ]
             
             return {
                 "success": True,
@@ -96,6 +327,10 @@ class PPTXSearchTool(BaseTool):
                     "slide_idx": {
                         "type": "integer",
                         "description": "Optional: specific slide index to search (0-based), if not provided searches all slides"
+                    },
+                    "whole_word": {
+                        "type": "boolean",
+                        "description": "Optional: match whole words only instead of any substring"
                     }
                 },
                 "required": ["search_term"]
@@ -106,19 +341,20 @@ class PPTXSearchTool(BaseTool):
 class PPTXReplaceTool(BaseTool):
     """Tool to replace text in PPTX content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="replace_pptx_text",
             description="Replace specific text in PowerPoint slides"
         )
-        self.session_content = None
-    
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
     
-    async def execute(self, old_text: str, new_text: str, slide_idx: Optional[int] = None) -> Dict[str, Any]:
+    async def execute(self, old_text: str, new_text: str, slide_idx: Optional[int] = None, glossary: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Replace text in PPTX content"""
+        return self._execute_sync(old_text, new_text, slide_idx, glossary)
+    
+    def _execute_sync(self, old_text: str, new_text: str, slide_idx: Optional[int] = None, glossary: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         logger.info(f"Replacing '{old_text}' with '{new_text}' in slide {slide_idx if slide_idx is not None else 'all'}")
         try:
             if not self.session_content:
@@ -135,34 +371,41 @@ class PPTXReplaceTool(BaseTool):
                     "error": "Invalid PPTX content structure"
                 }
             
+            if glossary:
+                # Batch mode: every (old -> new) pair, as whole words, in one trie scan per frame
+                replace_text = _KeywordTrie({old_text: new_text, **glossary}).replace
+            else:
+                # Case-insensitive match; the replacement is inserted literally
+                pattern = _compile_ci_pattern(old_text)
+                replace_text = partial(pattern.subn, lambda _match: new_text)
             replacements = []
-            slides_to_process = [slide_idx] if slide_idx is not None else range(len(content["slides"]))
+            # Edit through the session's flat deck so its cached text columns stay current
+            deck = _session_deck(self.session_ref)
+            positions = deck.slide_range(slide_idx) if slide_idx is not None else range(len(deck))
+            for position in positions:
+                # Only frames holding an editable "text" value are replaced
+                text_key = 'text'
+                text_frame = deck.nodes[position]
+                if text_key in text_frame:
+                    original_text = text_frame[text_key]
+                    # subn reports the count, so no separate search pass is needed
+                    new_full_text, count = replace_text(original_text)
+                    if count:
+                        deck.set_text(position, new_full_text)
+                        replacements.append({
+                            "slide_idx": deck.slide_idx[position],
+                            "shape_idx": deck.shape_idx[position],
+                            "frame_idx": deck.frame_idx[position],
+                            "text_key": text_key,
+                            "old_text": original_text,
+                            "new_text": new_full_text,
+                            "location": deck.location(position)
+                        })
             
-            for s_idx in slides_to_process:
-                if s_idx >= len(content["slides"]):
-                    continue
-                
-                slide = content["slides"][s_idx]
-                for shape_idx, shape in enumerate(slide.get("shapes", [])):                    
-                    for frame_idx, text_frame in enumerate(shape.get("text_frames", [])):
-                        # Check both translated_text and original_text
-                        text_key = 'text'
-                        if text_key in text_frame:
-                            original_text = text_frame[text_key]
-                            if re.search(re.escape(old_text), original_text, re.IGNORECASE):
-                                # Sử dụng regex để thay thế không phân biệt hoa thường
-                                pattern = re.compile(re.escape(old_text), re.IGNORECASE)
-                                new_full_text = pattern.sub(new_text, original_text)
-                                text_frame[text_key] = new_full_text
-                                replacements.append({
-                                    "slide_idx": s_idx,
-                                    "shape_idx": shape_idx,
-                                    "frame_idx": frame_idx,
-                                    "text_key": text_key,
-                                    "old_text": original_text,
-                                    "new_text": new_full_text,
-                                    "location": f"Slide {s_idx + 1}, Shape {shape_idx + 1}, Frame {frame_idx + 1}"
-                                })
+            if replacements:
+                # Edited frames have new tokens and previews; rebuild derived data lazily
+                self.session_ref.cache.pop("pptx_tokens", None)
+                self.session_ref.cache.pop("pptx_analysis", None)
             logger.info(f"Made {len(replacements)} replacements of '{old_text}' with '{new_text}'")
             return {
                 "success": True,
@@ -197,6 +440,11 @@ class PPTXReplaceTool(BaseTool):
                     "slide_idx": {
                         "type": "integer",
                         "description": "Optional: specific slide index to replace in (0-based), if not provided replaces in all slides"
+                    },
+                    "glossary": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "Optional: more {old: new} pairs replaced together with old_text in one pass (whole words, case-insensitive)"
                     }
                 },
                 "required": ["old_text", "new_text"]
@@ -207,19 +455,23 @@ class PPTXReplaceTool(BaseTool):
 class PPTXAnalyzeTool(BaseTool):
     """Tool to analyze PPTX structure and content"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="analyze_pptx_structure",
-            description="Analyze PowerPoint structure and provide content overview"
+            description=(
+                "Analyze PowerPoint structure and provide content overview; "
+                "text previews show each frame's current (translated or edited) text"
+            )
         )
-        self.session_content = None
-    
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
     
     async def execute(self) -> Dict[str, Any]:
         """Analyze PPTX structure"""
+        return self._execute_sync()
+    
+    def _execute_sync(self) -> Dict[str, Any]:
         try:
             if not self.session_content:
                 return {
@@ -235,43 +487,13 @@ class PPTXAnalyzeTool(BaseTool):
                     "error": "Invalid PPTX content structure"
                 }
             
-            analysis = {
-                "total_slides": len(content["slides"]),
-                "slides_overview": []
-            }
-            
-            for slide_idx, slide in enumerate(content["slides"]):
-                slide_info = {
-                    "slide_number": slide_idx + 1,
-                    "title": slide.get("title", f"Slide {slide_idx + 1}"),
-                    "shapes_count": len(slide.get("shapes", [])),
-                    "text_frames_count": 0,
-                    "text_preview": []
-                }
-                
-                for shape in slide.get("shapes", []):
-                    text_frames = shape.get("text_frames", [])
-                    slide_info["text_frames_count"] += len(text_frames)
-                    
-                    for text_frame in text_frames:
-                        text = text_frame.get("translated_text", text_frame.get("original_text", ""))
-                        if text.strip():
-                            preview = text[:100] + "..." if len(text) > 100 else text
-                            slide_info["text_preview"].append(preview)
-                
-                analysis["slides_overview"].append(slide_info)
-            
-            # Summary statistics
-            total_text_frames = sum(slide["text_frames_count"] for slide in analysis["slides_overview"])
-            total_shapes = sum(slide["shapes_count"] for slide in analysis["slides_overview"])
-            
-            analysis["summary"] = {
-                "total_slides": analysis["total_slides"],
-                "total_shapes": total_shapes,
-                "total_text_frames": total_text_frames,
-                "avg_shapes_per_slide": round(total_shapes / max(1, analysis["total_slides"]), 2),
-                "avg_text_frames_per_slide": round(total_text_frames / max(1, analysis["total_slides"]), 2)
-            }
+            # The analysis only depends on the content, so it is computed once per session
+            # content (replace edits drop it) and reused for repeated agent queries
+            analysis = self.session_ref.cache.get("pptx_analysis")
+            if analysis is None:
+                analysis = self.session_ref.cache["pptx_analysis"] = self._analyze(content)
+            total_shapes = analysis["summary"]["total_shapes"]
+            total_text_frames = analysis["summary"]["total_text_frames"]
             
             return {
                 "success": True,
@@ -285,6 +507,44 @@ class PPTXAnalyzeTool(BaseTool):
                 "error": f"Analysis failed: {str(e)}"
             }
     
+    def _analyze(self, content: Dict[str, Any]) -> Dict[str, Any]:
+        """Structure overview and summary statistics of PPTX content"""
+        analysis = {
+            "total_slides": len(content["slides"]),
+            "slides_overview": []
+        }
+        
+        # Frame-level data comes from the flat deck; only shape counts need the tree
+        deck = _session_deck(self.session_ref)
+        texts = deck.text
+        for slide_idx, slide in enumerate(content["slides"]):
+            frame_positions = deck.slide_range(slide_idx)
+            analysis["slides_overview"].append({
+                "slide_number": slide_idx + 1,
+                "title": slide.get("title", f"Slide {slide_idx + 1}"),
+                "shapes_count": len(slide.get("shapes", [])),
+                "text_frames_count": len(frame_positions),
+                "text_preview": [
+                    texts[position][:100] + "..." if deck.char_count[position] > 100 else texts[position]
+                    for position in frame_positions
+                    if texts[position].strip()
+                ]
+            })
+        
+        # Summary statistics
+        total_text_frames = sum(slide["text_frames_count"] for slide in analysis["slides_overview"])
+        total_shapes = sum(slide["shapes_count"] for slide in analysis["slides_overview"])
+        
+        analysis["summary"] = {
+            "total_slides": analysis["total_slides"],
+            "total_shapes": total_shapes,
+            "total_text_frames": total_text_frames,
+            "avg_shapes_per_slide": round(total_shapes / max(1, analysis["total_slides"]), 2),
+            "avg_text_frames_per_slide": round(total_text_frames / max(1, analysis["total_slides"]), 2)
+        }
+        
+        return analysis
+    
     def get_schema(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -300,19 +560,23 @@ class PPTXAnalyzeTool(BaseTool):
 class PPTXSlideInfoTool(BaseTool):
     """Tool to get detailed information about a specific slide"""
     
+    __slots__ = ()
+    supports_session_content = True
+    
     def __init__(self):
         super().__init__(
             name="get_pptx_slide_info",
-            description="Get detailed information about a specific PowerPoint slide"
+            description=(
+                "Get detailed information about a specific PowerPoint slide; each frame lists "
+                "its current text and char_count alongside its original_text"
+            )
         )
-        self.session_content = None
-    
-    def set_session_content(self, content: Dict[str, Any]):
-        """Set the session content for this tool"""
-        self.session_content = content
     
     async def execute(self, slide_idx: int) -> Dict[str, Any]:
         """Get detailed slide information"""
+        return self._execute_sync(slide_idx)
+    
+    def _execute_sync(self, slide_idx: int) -> Dict[str, Any]:
         try:
             if not self.session_content:
                 return {
@@ -343,6 +607,9 @@ class PPTXSlideInfoTool(BaseTool):
                 "shapes": []
             }
             
+            # Frames of the slide sit contiguously in the flat deck, in tree order
+            deck = _session_deck(self.session_ref)
+            position = deck.slide_starts[slide_idx]
             for shape_idx, shape in enumerate(slide.get("shapes", [])):
                 shape_info = {
                     "shape_index": shape_idx,
@@ -351,13 +618,15 @@ class PPTXSlideInfoTool(BaseTool):
                 }
                 
                 for frame_idx, text_frame in enumerate(shape.get("text_frames", [])):
+                    # char_count is of the current text, as used by search and replace
                     frame_info = {
                         "frame_index": frame_idx,
                         "original_text": text_frame.get("original_text", ""),
                         "translated_text": text_frame.get("translated_text", ""),
                         "text": text_frame.get("text", ""),
-                        "char_count": len(text_frame.get("translated_text", text_frame.get("original_text", "")))
+                        "char_count": deck.char_count[position]
                     }
+                    position += 1
                     shape_info["text_frames"].append(frame_info)
                 
                 slide_info["shapes"].append(shape_info)
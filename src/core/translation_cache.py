@@ -0,0 +1,133 @@
+"""
+Two-tier translation cache: a bounded in-memory LRU backed by an optional SQLite file
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Keys longer than this are stored as a 16-byte blake2b digest to bound row size
+MAX_RAW_KEY_LENGTH = 256
+
+
+def _storage_key(key: Union[str, bytes]) -> str:
+    """Normalize a cache key to the text stored in memory and on disk"""
+    if isinstance(key, bytes):
+        return key.hex()
+    if len(key) > MAX_RAW_KEY_LENGTH:
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return key
+
+
+class TranslationCache:
+    """LRU cache of translations, written through to SQLite when a path is given"""
+
+    def __init__(self, maxsize: int = 100_000, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+        if path:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, value TEXT)"
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent translation cache unavailable, using memory only: {e}")
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Union[str, bytes]) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: Union[str, bytes]) -> str:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Union[str, bytes], value: str):
+        self.update([(key, value)])
+
+    def get(self, key: Union[str, bytes], default: Optional[str] = None) -> Optional[str]:
+        """Look up memory first, then disk (promoting disk hits into memory)"""
+        stored_key = _storage_key(key)
+        with self._lock:
+            value = self._entries.get(stored_key)
+            if value is not None:
+                self._entries.move_to_end(stored_key)
+                self.stats["hits"] += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM translations WHERE key = ?", (stored_key,)
+                ).fetchone()
+                if row is not None:
+                    self._remember(stored_key, row[0])
+                    self.stats["hits"] += 1
+                    return row[0]
+
+            self.stats["misses"] += 1
+            return default
+
+    def update(self, items: Iterable[Tuple[Union[str, bytes], str]]):
+        """Store translations in memory and on disk in a single transaction"""
+        rows = [(_storage_key(key), value) for key, value in items]
+        with self._lock:
+            for stored_key, value in rows:
+                self._remember(stored_key, value)
+            if self._db is not None and rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO translations (key, value) VALUES (?, ?)", rows
+                )
+                self._db.commit()
+
+    def invalidate(self, key: Optional[Union[str, bytes]] = None):
+        """Drop one translation, or everything when no key is given"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                if self._db is not None:
+                    self._db.execute("DELETE FROM translations")
+                    self._db.commit()
+                return
+
+            stored_key = _storage_key(key)
+            self._entries.pop(stored_key, None)
+            if self._db is not None:
+                self._db.execute("DELETE FROM translations WHERE key = ?", (stored_key,))
+                self._db.commit()
+
+    def close(self):
+        """Close the SQLite connection"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, stored_key: str, value: str):
+        """Insert into the LRU tier, evicting the least recently used entries"""
+        self._entries[stored_key] = value
+        self._entries.move_to_end(stored_key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
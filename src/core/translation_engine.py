@@ -2,24 +2,117 @@
 Main translation engine that orchestrates different translation services
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
-from typing import Dict, Optional
+import re
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from core.translation_cache import TranslationCache
 
-from translate.openai_translator import OpenAITranslator
-from translate.azure_translator import AzureTranslator
 from translate.google_base import GoogleTranslator
 
 logger = logging.getLogger(__name__)
 
+# Texts per model request and concurrent requests in translate_batch
+BATCH_SIZE = 50
+MAX_CONCURRENT_BATCHES = 8
+
+
+# Texts with no letters (numbers, dates, bullets, punctuation) or a bare URL are never sent out
+_SKIP_RE = re.compile(r"^[\W\d_]+$")
+_URL_RE = re.compile(r"^(https?://|www\.)\S+$")
+
+
+def _is_translatable(text: str) -> bool:
+    """Whether the text has anything a translation backend could change"""
+    stripped = text.strip()
+    return bool(stripped) and not _SKIP_RE.match(stripped) and not _URL_RE.match(stripped)
+
+
+def _cache_key(
+    text: str,
+    target_lang,
+    source_lang,
+    custom_dict: Optional[Dict[str, str]],
+    context: Optional[str],
+) -> bytes:
+    """Digest of every input that affects a translation (length-prefixed, so fields can't run together)"""
+    h = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+    for field in (
+        text,
+        getattr(target_lang, "value", target_lang),
+        getattr(source_lang, "value", source_lang) or "auto",
+        json.dumps(custom_dict, sort_keys=True, ensure_ascii=False) if custom_dict else "",
+        context or "",
+    ):
+        data = str(field).encode("utf-8")
+        h.update(len(data).to_bytes(4, "little"))
+        h.update(data)
+    return h.digest()
+
+
+class _SyncTranslationEngine:
+    """Blocking facade over a TranslationEngine for scripts and CLI callers
+
+    Every call runs on one shared event loop (uvloop when installed) instead of
+    setting up and tearing down a loop per asyncio.run. Not for use from a running loop.
+    """
+
+    _runner: Optional[asyncio.Runner] = None
+
+    def __init__(self, engine: "TranslationEngine"):
+        self._engine = engine
+
+    @classmethod
+    def _get_runner(cls) -> asyncio.Runner:
+        if cls._runner is None:
+            cls._runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None)
+            atexit.register(cls._runner.close)
+        return cls._runner
+
+    def translate_text(self, *args, **kwargs) -> str:
+        return self._get_runner().run(self._engine.translate_text(*args, **kwargs))
+
+    def translate_batch(self, *args, **kwargs) -> List[str]:
+        return self._get_runner().run(self._engine.translate_batch(*args, **kwargs))
+
+    def translate_many(self, *args, **kwargs) -> List[str]:
+        return self._get_runner().run(self._engine.translate_many(*args, **kwargs))
+
 
 class TranslationEngine:
     """Handles AI-powered translation with context awareness"""
 
-    def __init__(self, openai_api_key: str = None, azure_api_key: str = None):
-        self.openai_translator = OpenAITranslator(api_key=openai_api_key) if openai_api_key else None
-        self.azure_translator = AzureTranslator(api_key=azure_api_key) if azure_api_key else None
+    def __init__(self, openai_api_key: str = None, azure_api_key: str = None, cache_path: Optional[str] = None):
+        # Backend SDKs are imported only when their key is configured
+        self.openai_translator = None
+        if openai_api_key:
+            from translate.openai_translator import OpenAITranslator
+
+            self.openai_translator = OpenAITranslator(api_key=openai_api_key)
+        self.azure_translator = None
+        if azure_api_key:
+            from translate.azure_translator import AzureTranslator
+
+            self.azure_translator = AzureTranslator(api_key=azure_api_key)
         self.google_translator = GoogleTranslator()
-        self.translation_cache = {}
+        # Bounded LRU; also persisted to SQLite when a cache path is given
+        self.translation_cache = TranslationCache(path=cache_path)
+        # Translations currently running, so concurrent callers for the same key share one call
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+
+    @property
+    def sync(self) -> _SyncTranslationEngine:
+        """Blocking versions of the translate methods, e.g. engine.sync.translate_text(...)"""
+        return _SyncTranslationEngine(self)
 
     async def translate_text(
         self,
@@ -31,10 +124,55 @@ class TranslationEngine:
     ) -> str:
         """Translate text with AI enhancement"""
 
+        if not _is_translatable(text):
+            return text
+
         # Check cache first
-        cache_key = f"{text}_{target_lang}_{source_lang or 'auto'}"
-        if cache_key in self.translation_cache:
-            return self.translation_cache[cache_key]
+        cache_key = _cache_key(text, target_lang, source_lang, custom_dict, context)
+        cached = self.translation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            # Shielded so a cancelled waiter doesn't cancel the call the others share
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        translated = None
+        error: Optional[BaseException] = None
+        try:
+            translated = await asyncio.to_thread(
+                self._translate_uncached, cache_key, text, target_lang, source_lang, custom_dict, context
+            )
+            return translated
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            del self._inflight[cache_key]
+            # Always resolve the shared future, cancellation included, so no waiter hangs
+            if not future.done():
+                if error is None:
+                    future.set_result(translated)
+                elif isinstance(error, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+                    # Mark the exception retrieved; only concurrent waiters need to see it
+                    future.exception()
+
+    def _translate_uncached(
+        self,
+        cache_key: bytes,
+        text: str,
+        target_lang: str,
+        source_lang: Optional[str],
+        custom_dict: Optional[Dict[str, str]],
+        context: Optional[str],
+    ) -> str:
+        """Call the best available backend (blocking) and cache its result"""
 
         try:
             # Use AI translation if available
@@ -50,7 +188,8 @@ class TranslationEngine:
                 translated = self.azure_translator.translate_text(
                     text=text,
                     target_lang=target_lang,
-                    source_lang=source_lang
+                    source_lang=source_lang,
+                    custom_dict=custom_dict
                 )
             else:
                 # Fallback to Google Translate
@@ -72,3 +211,123 @@ class TranslationEngine:
                 target_lang=target_lang,
                 source_lang=source_lang
             )
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        custom_dict: Optional[Dict[str, str]] = None,
+        context: Optional[str] = None,
+    ) -> List[str]:
+        """Translate many texts, sending cache misses to the model in batched requests"""
+
+        results: List[Optional[str]] = [None] * len(texts)
+        cache_keys = [_cache_key(text, target_lang, source_lang, custom_dict, context) for text in texts]
+        missing = []
+        for i, text in enumerate(texts):
+            cached = self.translation_cache.get(cache_keys[i])
+            if cached is not None:
+                results[i] = cached
+            elif not _is_translatable(text):
+                results[i] = text
+            else:
+                missing.append(i)
+
+        if not missing:
+            return results
+
+        if not self.openai_translator:
+            # Azure and Google batch on their own; send them all the misses at once
+            translated = await asyncio.to_thread(
+                self._translate_texts_uncached,
+                [texts[i] for i in missing],
+                target_lang,
+                source_lang,
+                custom_dict,
+            )
+            self._store_batch(results, cache_keys, [missing], [translated])
+            return results
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+        async def translate_chunk(chunk: List[int]) -> List[str]:
+            chunk_texts = [texts[i] for i in chunk]
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self.openai_translator.translate_batch,
+                        chunk_texts,
+                        target_lang,
+                        source_lang,
+                        context,
+                        custom_dict,
+                    )
+                except Exception as e:
+                    logger.warning(f"Batch translation failed, translating items individually: {e}")
+            return [
+                await self.translate_text(text, target_lang, source_lang, custom_dict, context)
+                for text in chunk_texts
+            ]
+
+        chunks = [missing[start:start + BATCH_SIZE] for start in range(0, len(missing), BATCH_SIZE)]
+        translated_chunks = await asyncio.gather(*(translate_chunk(chunk) for chunk in chunks))
+
+        self._store_batch(results, cache_keys, chunks, translated_chunks)
+        return results
+
+    def _translate_texts_uncached(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str],
+        custom_dict: Optional[Dict[str, str]],
+    ) -> List[str]:
+        """Translate texts through the Azure or Google batch path (blocking)"""
+
+        if self.azure_translator:
+            try:
+                return self.azure_translator.translate_texts(
+                    texts,
+                    target_lang=target_lang,
+                    source_lang=source_lang,
+                    custom_dict=custom_dict,
+                )
+            except Exception as e:
+                logger.error(f"Batch translation failed: {e}")
+        # Fallback to Google Translate
+        return self.google_translator.translate_texts(
+            texts, target_lang=target_lang, source_lang=source_lang
+        )
+
+    def _store_batch(
+        self,
+        results: List[Optional[str]],
+        cache_keys: List[bytes],
+        chunks: List[List[int]],
+        translated_chunks: Sequence[List[str]],
+    ):
+        """Place batch translations at their positions and cache them in one update"""
+        new_entries = []
+        for chunk, translated in zip(chunks, translated_chunks):
+            for i, translated_text in zip(chunk, translated):
+                results[i] = translated_text
+                new_entries.append((cache_keys[i], translated_text))
+        self.translation_cache.update(new_entries)
+
+    async def translate_many(
+        self,
+        texts: Sequence[str],
+        target_lang: str,
+        source_lang: Optional[str] = None,
+        custom_dict: Optional[Dict[str, str]] = None,
+        context: Optional[str] = None,
+    ) -> List[str]:
+        """Translate each distinct text once and scatter the results back to every occurrence"""
+
+        unique = dict.fromkeys(texts)
+        translated = await self.translate_batch(
+            list(unique), target_lang, source_lang, custom_dict, context
+        )
+        unique.update(zip(unique, translated))
+        return [unique[text] for text in texts]
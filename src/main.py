@@ -3,25 +3,96 @@ FastAPI Translation Service
 Main entry point for the translation API
 """
 
+import importlib.util
+import json
 import logging
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime
 
 import uvicorn
+from anyio import to_thread
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
 
 # Import API components
-from api.core.dependencies import init_translation_service
+from api.core.responses import FastJSONResponse
+from api.core.dependencies import (
+    init_document_pool,
+    init_translation_service,
+    shutdown_document_pool,
+)
 from api.v1.endpoints import translation_router
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cython event loop and HTTP parser when installed (uvicorn[standard]); stock asyncio/h11 otherwise
+UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+# Worker threads shared by blocking document work (AnyIO's default is 40)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL", "128"))
+
+# Production (ENV=prod) serves no Swagger/ReDoc pages and no OpenAPI schema
+PRODUCTION = os.getenv("ENV", "dev") == "prod"
+
+
+# Static part of the root payload; only the timestamp changes per request
+ROOT_INFO = {
+    "name": "Agent Translation API",
+    "version": "1.0.0",
+    "description": "Professional translation service with document processing",
+    # Docs are disabled in production, so they aren't advertised there either
+    "docs": None if PRODUCTION else "/docs",
+    "health": "/api/v1/translation/health",
+}
+
+HEALTH_INFO = {
+    "status": "healthy",
+    "service": "Agent Translation API",
+    "version": "1.0.0",
+}
+
+
+def _timestamped_body_prefix(payload: dict) -> bytes:
+    """Serialized payload left open for a trailing "timestamp" field"""
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return body[:-1].encode("utf-8") + b',"timestamp":"'
+
+
+# Serialized once at import; each request only appends its timestamp
+_ROOT_BODY_PREFIX = _timestamped_body_prefix(ROOT_INFO)
+_HEALTH_BODY_PREFIX = _timestamped_body_prefix(HEALTH_INFO)
+
+
+# Timestamp of the current second, formatted once per second rather than per request
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _timestamp() -> str:
+    """Current local time in ISO format, at one-second resolution"""
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = datetime.fromtimestamp(now).isoformat()
+        _last_ts_sec = now
+    return _last_ts_str
+
+
+def _timestamped_response(prefix: bytes) -> Response:
+    """JSON response from a precomputed body prefix plus the current timestamp"""
+    return Response(
+        prefix + _timestamp().encode("ascii") + b'"}',
+        media_type="application/json",
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,17 +100,20 @@ async def lifespan(app: FastAPI):
 
     # Startup
     logger.info("Starting Translation API...")
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     try:
         init_translation_service()
         logger.info("Translation service initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize translation service: {e}")
         raise
+    app.state.pdf_pool = init_document_pool()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Translation API...")
+    shutdown_document_pool()
 
 
 # Create FastAPI app
@@ -48,8 +122,10 @@ app = FastAPI(
     description="Professional translation service with document processing capabilities",
     version="1.0.0",
     lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url=None if PRODUCTION else "/docs",
+    redoc_url=None if PRODUCTION else "/redoc",
+    openapi_url=None if PRODUCTION else "/openapi.json",
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
@@ -61,17 +137,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress bulky JSON (translation logs, text arrays); added last so it wraps CORS
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "error": exc.detail,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "path": str(request.url),
         },
     )
@@ -81,19 +160,21 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=500,
         content={
             "success": False,
             "error": "Internal server error",
             "detail": str(exc),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "path": str(request.url),
         },
     )
 
 
 # Include routers
+# Endpoints are async; blocking document work (PyMuPDF, reportlab) must be offloaded to a
+# worker thread rather than run inline, or it stalls the event loop for every request
 app.include_router(translation_router, prefix="/api/v1")
 
 
@@ -101,26 +182,14 @@ app.include_router(translation_router, prefix="/api/v1")
 @app.get("/")
 async def root():
     """API root endpoint"""
-    return {
-        "name": "Agent Translation API",
-        "version": "1.0.0",
-        "description": "Professional translation service with document processing",
-        "docs": "/docs",
-        "health": "/api/v1/translation/health",
-        "timestamp": datetime.now().isoformat(),
-    }
+    return _timestamped_response(_ROOT_BODY_PREFIX)
 
 
 # Health check
 @app.get("/health")
 async def health_check():
     """Global health check"""
-    return {
-        "status": "healthy",
-        "service": "Agent Translation API",
-        "timestamp": datetime.now().isoformat(),
-        "version": "1.0.0",
-    }
+    return _timestamped_response(_HEALTH_BODY_PREFIX)
 
 
 def main():
@@ -148,10 +217,12 @@ def main():
     print(f"  Port: {port}")
     print(f"  Reload: {reload}")
     print(f"  Log Level: {log_level}")
+    print(f"  Event Loop: {UVICORN_LOOP} / HTTP: {UVICORN_HTTP}")
     print()
 
     print("Starting server...")
-    print(f"📖 API Documentation: http://{host}:{port}/docs")
+    if not PRODUCTION:
+        print(f"📖 API Documentation: http://{host}:{port}/docs")
     print(f"🔍 Health Check: http://{host}:{port}/health")
     print(f"🚀 Ready to translate!")
     print()
@@ -164,6 +235,11 @@ def main():
         reload=reload,
         log_level=log_level,
         access_log=True,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        proxy_headers=True,
+        server_header=False,
+        date_header=False,
     )
 
 
@@ -2,12 +2,25 @@
 Document processors package
 """
 
-from .base import BaseDocumentProcessor, DocumentProcessor
-from .docx_processor import DOCXProcessor
-from .pdf_processor import PDFProcessor
-from .pptx_processor import PPTXProcessor
-from .txt_processor import TXTProcessor
-from .xlsx_processor import XLSXProcessor
+import importlib
+
+from .base import BaseDocumentProcessor, DocumentProcessor, PROCESSOR_CLASSES
+
+# Processors load on first access, so importing one doesn't pull in every document library
+_LAZY_PROCESSORS = {class_name: module_name for module_name, class_name in PROCESSOR_CLASSES.values()}
+
+
+def __getattr__(name):
+    module_name = _LAZY_PROCESSORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_PROCESSORS))
 
 __all__ = [
     "DocumentProcessor",
@@ -2,12 +2,29 @@
 Base document processor interface
 """
 
+import importlib
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 from translate.google_base import GoogleTranslator
 
+# Processor class for each supported extension, as (module, class name)
+PROCESSOR_CLASSES: Dict[str, Tuple[str, str]] = {
+    ".pdf": ("processors.pdf_processor", "PDFProcessor"),
+    ".docx": ("processors.docx_processor", "DOCXProcessor"),
+    ".pptx": ("processors.pptx_processor", "PPTXProcessor"),
+    ".xlsx": ("processors.xlsx_processor", "XLSXProcessor"),
+    ".txt": ("processors.txt_processor", "TXTProcessor"),
+}
+
+# Translations remembered across documents and requests. They live in the translator's
+# shared cache, which keeps the largest size and TTL any caller configured, so other
+# GoogleTranslator users can't shrink it; entries expire after TRANSLATION_MEMORY_TTL
+TRANSLATION_MEMORY_SIZE = 200_000
+TRANSLATION_MEMORY_TTL = 30 * 24 * 3600
+
 
 class BaseDocumentProcessor(ABC):
     """Base class for document processors"""
@@ -40,24 +57,55 @@ class BaseDocumentProcessor(ABC):
         return extracted_content
 
 
+class LazyProcessorMap(Mapping):
+    """Extension → processor mapping that imports and builds each processor on first lookup
+
+    Membership and iteration only consult the extension table, so listing supported
+    formats doesn't load fitz, python-docx, python-pptx or openpyxl.
+    """
+
+    def __init__(self, classes: Dict[str, Tuple[str, str]] = PROCESSOR_CLASSES):
+        self._classes = classes
+        self._instances: Dict[str, "BaseDocumentProcessor"] = {}
+
+    def __getitem__(self, ext: str) -> "BaseDocumentProcessor":
+        processor = self._instances.get(ext)
+        if processor is None:
+            module_name, class_name = self._classes[ext]
+            processor = getattr(importlib.import_module(module_name), class_name)()
+            self._instances[ext] = processor
+        return processor
+
+    def __contains__(self, ext) -> bool:
+        return ext in self._classes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+# Processors of a worker process running extract_document
+_worker_processors = None
+
+
+def extract_document(ext: str, file_path: str) -> Dict[str, Any]:
+    """Extract a document's content by extension; picklable entry point for process pools"""
+    global _worker_processors
+    if _worker_processors is None:
+        _worker_processors = LazyProcessorMap()
+    return _worker_processors[ext].extract_text(file_path)
+
+
 class DocumentProcessor:
     """Main document processor that handles various file formats"""
 
     def __init__(self):
-        from processors.docx_processor import DOCXProcessor
-        from processors.pdf_processor import PDFProcessor
-        from processors.pptx_processor import PPTXProcessor
-        from processors.txt_processor import TXTProcessor
-        from processors.xlsx_processor import XLSXProcessor
-
-        self.processors = {
-            ".pdf": PDFProcessor(),
-            ".docx": DOCXProcessor(),
-            ".pptx": PPTXProcessor(),
-            ".xlsx": XLSXProcessor(),
-            ".txt": TXTProcessor(),
-        }
-        self.translator = GoogleTranslator()
+        self.processors = LazyProcessorMap()
+        self.translator = GoogleTranslator(
+            cache_size=TRANSLATION_MEMORY_SIZE, cache_ttl=TRANSLATION_MEMORY_TTL
+        )
 
     def _get_processor(self, ext: str) -> BaseDocumentProcessor:
         """Get the appropriate processor based on file extension"""
@@ -72,6 +120,12 @@ class DocumentProcessor:
         if ext in self.processors:
             processor = self._get_processor(ext)
             output_path = f"{Path(file_path).stem}_translated{ext}"
+
+            # Processors that can translate while walking the file skip the content dict
+            translate_streaming = getattr(processor, "translate_streaming", None)
+            if translate_streaming is not None:
+                return translate_streaming(file_path, output_path, self.translator.translate_texts)
+
             extracted_content = processor.extract_text(file_path)
             # print(extracted_content)
             translatable_texts = processor.get_translatable_texts(extracted_content)
@@ -2,9 +2,11 @@
 PDF document processor với hỗ trợ font tiếng Việt
 """
 
-import copy
+import multiprocessing
 import os
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
 
 import fitz
 from reportlab.lib.pagesizes import letter
@@ -15,6 +17,106 @@ from reportlab.pdfgen import canvas
 
 from processors.base import BaseDocumentProcessor
 
+# Span fields kept as a line's font_info
+FONT_INFO_KEYS = ("size", "font", "flags", "color")
+
+# Documents with at least this many pages are extracted by a process pool; below it,
+# starting the workers costs more than it saves
+PARALLEL_MIN_PAGES = 200
+
+# Font hệ thống hỗ trợ tiếng Việt, thử theo thứ tự
+FONT_PATHS = (
+    "/System/Library/Fonts/Arial.ttf",  # macOS
+    "/Windows/Fonts/arial.ttf",  # Windows
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+    "C:/Windows/Fonts/times.ttf",  # Windows Times New Roman
+)
+
+# Tên font reportlab đã chọn; None khi chưa dò
+_REGISTERED_FONT: Optional[str] = None
+_font_lock = threading.Lock()
+
+
+def _ensure_font() -> str:
+    """Register the Vietnamese font with reportlab once per process and return its name"""
+    global _REGISTERED_FONT
+    if _REGISTERED_FONT is not None:
+        return _REGISTERED_FONT
+
+    with _font_lock:
+        if _REGISTERED_FONT is None:
+            font_name = "Helvetica"
+            for font_path in FONT_PATHS:
+                if os.path.exists(font_path):
+                    try:
+                        pdfmetrics.registerFont(TTFont("VietnameseFont", font_path))
+                        font_name = "VietnameseFont"
+                        break
+                    except Exception:
+                        continue
+
+            if font_name == "Helvetica":
+                print("Không tìm thấy font Unicode, sử dụng font mặc định")
+            _REGISTERED_FONT = font_name
+    return _REGISTERED_FONT
+
+
+def _page_content(page, page_num: int) -> Dict[str, Any]:
+    """Text structure of one page: its text blocks and their non-blank lines"""
+    text_blocks = []
+    append_block = text_blocks.append
+
+    # Get text blocks with position information; TEXTFLAGS_TEXT leaves out image
+    # blocks, which would otherwise carry every embedded image's bytes
+    text_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)
+
+    for block_idx, block in enumerate(text_dict["blocks"]):
+        # type 0 marks a text block
+        if block["type"] != 0:
+            continue
+        block_lines = block["lines"]
+        if not block_lines:
+            continue
+
+        lines = []
+        for line_idx, line in enumerate(block_lines):
+            spans = line["spans"]
+            line_text = "".join(span["text"] for span in spans).strip()
+
+            if line_text:
+                first_span = spans[0]
+                lines.append(
+                    {
+                        "line_index": line_idx,
+                        "text": line_text,
+                        "original_text": line_text,
+                        "bbox": line["bbox"],
+                        # Only the font fields, not the whole span (text, bbox, origin...)
+                        "font_info": {
+                            key: first_span[key]
+                            for key in FONT_INFO_KEYS
+                            if key in first_span
+                        },
+                    }
+                )
+
+        if lines:
+            append_block(
+                {
+                    "block_index": block_idx,
+                    "bbox": block["bbox"],  # Position information
+                    "lines": lines,
+                }
+            )
+
+    return {"page_number": page_num + 1, "text_blocks": text_blocks}
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[Dict[str, Any]]:
+    """Worker entry point: reopen the PDF and extract pages [start, stop)"""
+    with fitz.open(file_path) as doc:
+        return [_page_content(doc[page_num], page_num) for page_num in range(start, stop)]
+
 
 class PDFProcessor(BaseDocumentProcessor):
     """Processor for PDF documents với hỗ trợ font Unicode"""
@@ -22,81 +124,72 @@ class PDFProcessor(BaseDocumentProcessor):
     def __init__(self):
         super().__init__()
         # Danh sách các font Unicode hỗ trợ tiếng Việt
-        self.unicode_fonts = [
+        self.unicode_fonts = (
             "Arial Unicode MS",
             "Times New Roman",
             "Tahoma",
             "Verdana",
             "DejaVu Sans",
             "Liberation Sans",
-        ]
-
-    def extract_text(self, file_path: str) -> Dict[str, Any]:
-        """Extract text content from PDF while preserving structure"""
-        doc = fitz.open(file_path)
-        content = {"pages": []}
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_content = {"page_number": page_num + 1, "text_blocks": []}
-
-            # Get text blocks with position information
-            text_dict = page.get_text("dict")
-
-            for block_idx, block in enumerate(text_dict["blocks"]):
-                if "lines" in block:  # Text block
-                    block_data = {
-                        "block_index": block_idx,
-                        "bbox": block["bbox"],  # Position information
-                        "lines": [],
-                    }
-
-                    for line_idx, line in enumerate(block["lines"]):
-                        line_text = ""
-                        font_info = None
-
-                        for span in line["spans"]:
-                            line_text += span["text"]
-                            if not font_info:
-                                font_info = span
-
-                        if line_text.strip():
-                            block_data["lines"].append(
-                                {
-                                    "line_index": line_idx,
-                                    "text": line_text.strip(),
-                                    "original_text": line_text.strip(),
-                                    "bbox": line["bbox"],
-                                    "font_info": font_info,
-                                }
-                            )
-
-                    if block_data["lines"]:
-                        page_content["text_blocks"].append(block_data)
+        )
 
-            content["pages"].append(page_content)
-
-        doc.close()
-        return content
-
-    def _find_best_font(self, doc, preferred_size=12):
-        """Tìm font tốt nhất hỗ trợ Unicode"""
+        # Dò font một lần khi khởi tạo; fallback: Helvetica
+        self._resolved_font_name = "helv"
+        self._resolved_font_obj = None
         for font_name in self.unicode_fonts:
             try:
-                # Thử load font
-                font = fitz.Font(font_name)
-                return font_name
-            except:
+                self._resolved_font_obj = fitz.Font(font_name)
+            except Exception:
                 continue
+            self._resolved_font_name = font_name
+            break
+
+    def extract_text(self, file_path: str) -> Dict[str, Any]:
+        """Extract text content from PDF while preserving structure
+
+        Documents of PARALLEL_MIN_PAGES pages or more are split into page ranges
+        extracted by worker processes, one range per CPU. Already inside a worker
+        process (such as the server's extraction pool) extraction stays sequential.
+        """
+        with fitz.open(file_path) as doc:
+            page_count = len(doc)
+            workers = min(os.cpu_count() or 1, page_count)
+            in_worker = multiprocessing.parent_process() is not None
+            if page_count < PARALLEL_MIN_PAGES or workers < 2 or in_worker:
+                return {"pages": list(self.iter_pages(doc))}
+        return {"pages": self._extract_pages_parallel(file_path, page_count, workers)}
+
+    def _extract_pages_parallel(
+        self, file_path: str, page_count: int, workers: int
+    ) -> List[Dict[str, Any]]:
+        """Extract contiguous page ranges in worker processes and merge them in page order"""
+        step = -(-page_count // workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        # Spawned rather than forked: extraction runs on server worker threads
+        with ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(_extract_page_range, file_path, start, stop) for start, stop in ranges
+            ]
+            return [page for future in futures for page in future.result()]
 
-        # Fallback: sử dụng font mặc định
-        return "helv"  # Helvetica
+    def iter_pages(self, doc) -> Iterator[Dict[str, Any]]:
+        """Yield each page's text structure in turn, so only one page's raw text dict is alive"""
+        for page_num, page in enumerate(doc):
+            yield _page_content(page, page_num)
+
+    def _find_best_font(self, doc, preferred_size=12):
+        """Font tốt nhất hỗ trợ Unicode, đã dò sẵn trong __init__"""
+        return self._resolved_font_name
 
     def reconstruct_document(
         self, original_path: str, translated_content: Dict[str, Any], output_path: str
     ) -> str:
         """Reconstruct PDF by overlaying translated text on original"""
         original_doc = fitz.open(original_path)
+        # Sử dụng font hỗ trợ Unicode
+        font_name = self._find_best_font(original_doc)
 
         for page_data in translated_content["pages"]:
             page_num = page_data["page_number"] - 1
@@ -104,12 +197,15 @@ class PDFProcessor(BaseDocumentProcessor):
                 continue
 
             page = original_doc[page_num]
+            # Mọi hình chữ nhật và text của trang gom vào một Shape, ghi một lần khi commit
+            shape = page.new_shape()
 
             # Remove original text blocks and add translated ones
             for block_data in page_data["text_blocks"]:
                 # Clear original text area (white rectangle)
                 bbox = fitz.Rect(block_data["bbox"])
-                page.draw_rect(bbox, color=(1, 1, 1), fill=(1, 1, 1))
+                shape.draw_rect(bbox)
+                shape.finish(color=(1, 1, 1), fill=(1, 1, 1))
 
                 # Add translated text với font Unicode
                 y_offset = bbox.y0
@@ -119,11 +215,8 @@ class PDFProcessor(BaseDocumentProcessor):
                         if line_data.get("font_info"):
                             font_size = line_data["font_info"].get("size", 12)
 
-                        # Sử dụng font hỗ trợ Unicode
-                        font_name = self._find_best_font(original_doc, font_size)
-
                         try:
-                            page.insert_text(
+                            shape.insert_text(
                                 (bbox.x0, y_offset + font_size),
                                 line_data["text"],
                                 fontsize=font_size,
@@ -134,7 +227,7 @@ class PDFProcessor(BaseDocumentProcessor):
                         except Exception as e:
                             print(f"Lỗi khi chèn text: {e}")
                             # Fallback: sử dụng font mặc định
-                            page.insert_text(
+                            shape.insert_text(
                                 (bbox.x0, y_offset + font_size),
                                 line_data["text"],
                                 fontsize=font_size,
@@ -143,6 +236,9 @@ class PDFProcessor(BaseDocumentProcessor):
 
                         y_offset += font_size + 2
 
+            # Text content is written after the drawings, so it lands above every rectangle
+            shape.commit(overlay=True)
+
         original_doc.save(output_path)
         original_doc.close()
         return output_path
@@ -151,45 +247,21 @@ class PDFProcessor(BaseDocumentProcessor):
         self, original_path: str, translated_content: Dict[str, Any], output_path: str
     ) -> str:
         """Phương pháp thay thế sử dụng ReportLab để tạo PDF mới"""
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-        from reportlab.pdfgen import canvas
-
-        # Đăng ký font tiếng Việt
-        try:
-            # Thử load font hệ thống
-            font_paths = [
-                "/System/Library/Fonts/Arial.ttf",  # macOS
-                "/Windows/Fonts/arial.ttf",  # Windows
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-                "C:/Windows/Fonts/times.ttf",  # Windows Times New Roman
-            ]
-
-            font_registered = False
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    try:
-                        pdfmetrics.registerFont(TTFont("VietnameseFont", font_path))
-                        font_registered = True
-                        break
-                    except:
-                        continue
-
-            if not font_registered:
-                print("Không tìm thấy font Unicode, sử dụng font mặc định")
-
-        except Exception as e:
-            print(f"Lỗi khi đăng ký font: {e}")
+        # Đăng ký font tiếng Việt (chỉ dò và đăng ký ở lần gọi đầu tiên)
+        font_name = _ensure_font()
 
         # Tạo PDF mới
         c = canvas.Canvas(output_path, pagesize=letter)
+        page_width, page_height = letter
 
         for page_data in translated_content["pages"]:
-            page_width, page_height = letter
+            # showPage resets the canvas font, so track the current size per page
+            current_size = None
 
             for block_data in page_data["text_blocks"]:
-                bbox = block_data["bbox"]
+                x_pos, block_top = block_data["bbox"][0], block_data["bbox"][1]
+                # Chuyển đổi tọa độ (PDF có gốc ở góc dưới trái)
+                baseline = page_height - block_top
 
                 for line_data in block_data["lines"]:
                     if line_data["text"].strip():
@@ -197,47 +269,56 @@ class PDFProcessor(BaseDocumentProcessor):
                         if line_data.get("font_info"):
                             font_size = line_data["font_info"].get("size", 12)
 
-                        # Sử dụng font đã đăng ký
-                        try:
-                            c.setFont("VietnameseFont", font_size)
-                        except:
-                            c.setFont("Helvetica", font_size)
-
-                        # Chuyển đổi tọa độ (PDF có gốc ở góc dưới trái)
-                        y_pos = page_height - bbox[1] - font_size
+                        if font_size != current_size:
+                            c.setFont(font_name, font_size)
+                            current_size = font_size
 
-                        c.drawString(bbox[0], y_pos, line_data["text"])
+                        c.drawString(x_pos, baseline - font_size, line_data["text"])
 
             c.showPage()
 
         c.save()
         return output_path
 
+    @staticmethod
+    def _translatable_lines(content: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Các dòng có text cần dịch, theo thứ tự trang → block → dòng"""
+        return [
+            line_data
+            for page_data in content["pages"]
+            for block_data in page_data["text_blocks"]
+            for line_data in block_data["lines"]
+            if line_data["text"].strip()
+        ]
+
     def get_translatable_texts(self, extracted_content: Dict[str, Any]) -> List[str]:
         """Extract all translatable texts from PDF content"""
-        texts = []
-        for page_data in extracted_content["pages"]:
-            for block_data in page_data["text_blocks"]:
-                for line_data in block_data["lines"]:
-                    if line_data["text"].strip():
-                        texts.append(line_data["text"])
-        return texts
+        return [line_data["text"] for line_data in self._translatable_lines(extracted_content)]
 
     def apply_translations(
         self, extracted_content: Dict[str, Any], translations: List[str]
     ) -> Dict[str, Any]:
         """Apply translations to PDF content structure"""
-        translated_content = copy.deepcopy(extracted_content)
-        translation_idx = 0
-
-        for page_data in translated_content["pages"]:
-            for block_data in page_data["text_blocks"]:
-                for line_data in block_data["lines"]:
-                    if line_data["text"].strip() and translation_idx < len(
-                        translations
-                    ):
-                        line_data["text"] = translations[translation_idx]
-                        translation_idx += 1
+        # Copy only the containers down to the lines; bbox and font_info are shared, not copied
+        translated_content = {
+            **extracted_content,
+            "pages": [
+                {
+                    **page_data,
+                    "text_blocks": [
+                        {**block_data, "lines": [dict(line) for line in block_data["lines"]]}
+                        for block_data in page_data["text_blocks"]
+                    ],
+                }
+                for page_data in extracted_content["pages"]
+            ],
+        }
+
+        # The flat line list lines up with the translations; zip stops at the shorter one
+        for line_data, translation in zip(
+            self._translatable_lines(translated_content), translations
+        ):
+            line_data["text"] = translation
 
         return translated_content
 
@@ -269,9 +350,7 @@ class PDFProcessor(BaseDocumentProcessor):
         self, translated_content: Dict[str, Any], output_path: str
     ) -> str:
         """Tạo PDF chỉ có text đơn giản"""
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
+        font_name = _ensure_font()
         c = canvas.Canvas(output_path, pagesize=letter)
         width, height = letter
 
@@ -294,7 +373,7 @@ class PDFProcessor(BaseDocumentProcessor):
                         max_width = width - 100
 
                         try:
-                            c.setFont("Helvetica", 10)
+                            c.setFont(font_name, 10)
                             c.drawString(50, y_position, text)
                         except:
                             # Nếu có ký tự đặc biệt không hiển thị được
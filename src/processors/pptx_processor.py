@@ -2,13 +2,37 @@
 PPTX document processor - Improved version
 """
 
-import copy
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from pptx import Presentation
 
 from processors.base import BaseDocumentProcessor
 
+# Texts translated per call when streaming a presentation
+STREAM_CHUNK_SIZE = 64
+
+
+def _iter_text_slots(content: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """(dict, key) of every translatable text in the content, in translation order"""
+    for slide_data in content["slides"]:
+        for shape_data in slide_data["shapes"]:
+            # Text frames
+            if shape_data["text_frames"]:
+                for frame_data in shape_data["text_frames"]:
+                    if frame_data["text"].strip():
+                        yield frame_data, "text"
+
+            # Direct text content
+            elif shape_data["text_content"]:
+                yield shape_data, "text_content"
+
+            # Table text
+            elif shape_data.get("table_data"):
+                for row_data in shape_data["table_data"]:
+                    for cell_data in row_data["cells"]:
+                        if cell_data["text"].strip():
+                            yield cell_data, "text"
+
 
 class PPTXProcessor(BaseDocumentProcessor):
     """Processor for PPTX documents"""
@@ -16,76 +40,139 @@ class PPTXProcessor(BaseDocumentProcessor):
     def extract_text(self, file_path: str) -> Dict[str, Any]:
         """Extract text content from PPTX while preserving structure and shape metadata"""
         prs = Presentation(file_path)
-        content = {"slides": []}
+        return {"slides": list(self.iter_slides(prs))}
 
+    def iter_slides(self, prs) -> Iterator[Dict[str, Any]]:
+        """Yield each slide's structure in turn, keeping only shapes that have text"""
         for slide_num, slide in enumerate(prs.slides):
-            slide_content = {"slide_number": slide_num + 1, "shapes": []}
-
-            for shape_idx, shape in enumerate(slide.shapes):
-                shape_data = {
-                    "shape_index": shape_idx,
-                    "shape_type": str(shape.shape_type),
-                    "shape_id": shape.shape_id if hasattr(shape, "shape_id") else None,
-                    "text_content": None,
-                    "has_text_frame": False,
-                    "text_frames": [],
-                }
-
-                # Handle shapes with text
+            yield {
+                "slide_number": slide_num + 1,
+                "shapes": [
+                    shape_data
+                    for shape_idx, shape in enumerate(slide.shapes)
+                    if (shape_data := self._shape_data(shape_idx, shape)) is not None
+                ],
+            }
+
+    def _shape_data(self, shape_idx: int, shape) -> Optional[Dict[str, Any]]:
+        """Structure of one shape's text, or None when it has none"""
+        shape_data = {
+            "shape_index": shape_idx,
+            "shape_type": str(shape.shape_type),
+            "shape_id": shape.shape_id if hasattr(shape, "shape_id") else None,
+            "text_content": None,
+            "has_text_frame": False,
+            "text_frames": [],
+        }
+
+        # Handle shapes with text
+        if hasattr(shape, "text_frame") and shape.text_frame:
+            shape_data["has_text_frame"] = True
+            for para_idx, paragraph in enumerate(shape.text_frame.paragraphs):
+                para_text = paragraph.text.strip()
+                if para_text:
+                    shape_data["text_frames"].append(
+                        {
+                            "paragraph_index": para_idx,
+                            "text": para_text,
+                            "original_text": para_text,  # Keep original for reference
+                        }
+                    )
+
+        # Handle shapes with direct text property
+        elif hasattr(shape, "text") and shape.text.strip():
+            shape_data["text_content"] = shape.text.strip()
+
+        # Handle table shapes
+        elif hasattr(shape, "table"):
+            table_data = []
+            for row_idx, row in enumerate(shape.table.rows):
+                row_data = []
+                for cell_idx, cell in enumerate(row.cells):
+                    cell_text = cell.text.strip()
+                    row_data.append(
+                        {
+                            "cell_index": cell_idx,
+                            "text": cell_text,
+                            "original_text": cell_text,
+                        }
+                    )
+                table_data.append({"row_index": row_idx, "cells": row_data})
+            shape_data["table_data"] = table_data
+
+        # Only keep shapes that have text content
+        if (
+            shape_data["text_content"]
+            or shape_data["text_frames"]
+            or shape_data.get("table_data")
+        ):
+            return shape_data
+        return None
+
+    def iter_translatable(self, prs) -> Iterator[Tuple[Any, str]]:
+        """
+        Walk a presentation yielding its translatable texts as they are reached
+        Param:
+            prs: An open python-pptx Presentation
+        Returns:
+            Iterator of (slot, text) pairs, in the same order as get_translatable_texts;
+            slot is the paragraph, shape or table cell whose .text takes the translation
+        """
+        for slide in prs.slides:
+            for shape in slide.shapes:
                 if hasattr(shape, "text_frame") and shape.text_frame:
-                    shape_data["has_text_frame"] = True
-                    for para_idx, paragraph in enumerate(shape.text_frame.paragraphs):
+                    for paragraph in shape.text_frame.paragraphs:
                         para_text = paragraph.text.strip()
                         if para_text:
-                            shape_data["text_frames"].append(
-                                {
-                                    "paragraph_index": para_idx,
-                                    "text": para_text,
-                                    "original_text": para_text,  # Keep original for reference
-                                }
-                            )
-
-                # Handle shapes with direct text property
-                elif hasattr(shape, "text") and shape.text.strip():
-                    shape_data["text_content"] = shape.text.strip()
-
-                # Handle table shapes
+                            yield paragraph, para_text
+                elif hasattr(shape, "text"):
+                    shape_text = shape.text.strip()
+                    if shape_text:
+                        yield shape, shape_text
                 elif hasattr(shape, "table"):
-                    table_data = []
-                    for row_idx, row in enumerate(shape.table.rows):
-                        row_data = []
-                        for cell_idx, cell in enumerate(row.cells):
+                    for row in shape.table.rows:
+                        for cell in row.cells:
                             cell_text = cell.text.strip()
                             if cell_text:
-                                row_data.append(
-                                    {
-                                        "cell_index": cell_idx,
-                                        "text": cell_text,
-                                        "original_text": cell_text,
-                                    }
-                                )
-                            else:
-                                row_data.append(
-                                    {
-                                        "cell_index": cell_idx,
-                                        "text": "",
-                                        "original_text": "",
-                                    }
-                                )
-                        table_data.append({"row_index": row_idx, "cells": row_data})
-                    shape_data["table_data"] = table_data
-
-                # Only add shapes that have text content
-                if (
-                    shape_data["text_content"]
-                    or shape_data["text_frames"]
-                    or shape_data.get("table_data")
-                ):
-                    slide_content["shapes"].append(shape_data)
-
-            content["slides"].append(slide_content)
-
-        return content
+                                yield cell, cell_text
+
+    def translate_streaming(
+        self,
+        file_path: str,
+        output_path: str,
+        translate: Callable[[List[str]], List[str]],
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> str:
+        """
+        Translate a PPTX file chunk by chunk while walking it, without building the content dict
+        Param:
+            file_path (str): The PPTX file to translate
+            output_path (str): Where to save the translated presentation
+            translate (Callable): Translates a list of texts, returning them in order
+            chunk_size (int): Texts sent to translate at a time
+        Returns:
+            str: output_path
+        """
+        prs = Presentation(file_path)
+        slots: List[Any] = []
+        texts: List[str] = []
+
+        def flush():
+            for slot, translation in zip(slots, translate(texts)):
+                slot.text = translation
+            slots.clear()
+            texts.clear()
+
+        for slot, text in self.iter_translatable(prs):
+            slots.append(slot)
+            texts.append(text)
+            if len(texts) >= chunk_size:
+                flush()
+        if texts:
+            flush()
+
+        prs.save(output_path)
+        return output_path
 
     def reconstruct_document(
         self, original_path: str, translated_content: Dict[str, Any], output_path: str
@@ -155,27 +242,8 @@ class PPTXProcessor(BaseDocumentProcessor):
             extracted_content (Dict[str, Any]): The content structure extracted from the PPTX file
         Returns:
             List[str]: List of all translatable texts found in the content"""
-        texts = []
-
-        for slide_data in extracted_content["slides"]:
-            for shape_data in slide_data["shapes"]:
-                # Get text from text frames
-                if shape_data["text_frames"]:
-                    for frame_data in shape_data["text_frames"]:
-                        if frame_data["text"].strip():
-                            texts.append(frame_data["text"])
+        return [slot[key] for slot, key in _iter_text_slots(extracted_content)]
 
-                # Get direct text content
-                elif shape_data["text_content"]:
-                    texts.append(shape_data["text_content"])
-                # Get table text
-                elif shape_data.get("table_data"):
-                    for row_data in shape_data["table_data"]:
-                        for cell_data in row_data["cells"]:
-                            if cell_data["text"].strip():
-                                texts.append(cell_data["text"])
-        return texts
-    
     def get_pairs_translation(self, translated_content: Dict[str, Any]) -> Dict[str, str]:
         """
         Extract original->translated pairs from the translated content structure
@@ -208,42 +276,53 @@ class PPTXProcessor(BaseDocumentProcessor):
         return pairs
 
     def apply_translations(
-        self, extracted_content: Dict[str, Any], translations: List[str]
+        self,
+        extracted_content: Dict[str, Any],
+        translations: List[str],
+        in_place: bool = False,
     ) -> Dict[str, Any]:
         """
         Apply translations to the extracted content structure
         Param:
             extracted_content (Dict[str, Any]): The original extracted content structure
             translations (List[str]): List of translated texts to apply
+            in_place (bool): Write into extracted_content instead of a copy of it
         Returns:
             Dict[str, Any]: The translated content structure with applied translations
         """
-        translated_content = copy.deepcopy(extracted_content)
-        translation_idx = 0
+        if in_place:
+            translated_content = extracted_content
+        else:
+            # Copy only the dicts holding texts; everything else is shared, not copied
+            translated_content = {
+                **extracted_content,
+                "slides": [
+                    {
+                        **slide_data,
+                        "shapes": [
+                            self._clone_shape(shape_data) for shape_data in slide_data["shapes"]
+                        ],
+                    }
+                    for slide_data in extracted_content["slides"]
+                ],
+            }
+
+        # Same walk as get_translatable_texts; zip stops at the shorter one
+        for (slot, key), translation in zip(_iter_text_slots(translated_content), translations):
+            slot[key] = translation
 
-        for slide_data in translated_content["slides"]:
-            for shape_data in slide_data["shapes"]:
-                # Apply translations to text frames
-                if shape_data["text_frames"]:
-                    for frame_data in shape_data["text_frames"]:
-                        if frame_data["text"].strip() and translation_idx < len(
-                            translations
-                        ):
-                            frame_data["text"] = translations[translation_idx]
-                            translation_idx += 1
-
-                # Apply translation to direct text content
-                elif shape_data["text_content"] and translation_idx < len(translations):
-                    shape_data["text_content"] = translations[translation_idx]
-                    translation_idx += 1
-
-                # Apply translations to table content
-                elif shape_data.get("table_data"):
-                    for row_data in shape_data["table_data"]:
-                        for cell_data in row_data["cells"]:
-                            if cell_data["text"].strip() and translation_idx < len(
-                                translations
-                            ):
-                                cell_data["text"] = translations[translation_idx]
-                                translation_idx += 1
         return translated_content
+
+    @staticmethod
+    def _clone_shape(shape_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a shape's dict with its text frames and table cells copied too"""
+        shape_copy = {
+            **shape_data,
+            "text_frames": [dict(frame_data) for frame_data in shape_data["text_frames"]],
+        }
+        if shape_data.get("table_data"):
+            shape_copy["table_data"] = [
+                {**row_data, "cells": [dict(cell_data) for cell_data in row_data["cells"]]}
+                for row_data in shape_data["table_data"]
+            ]
+        return shape_copy
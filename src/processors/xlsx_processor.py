@@ -2,8 +2,7 @@
 XLSX document processor
 """
 
-import copy
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 import openpyxl
 from openpyxl import Workbook, load_workbook
@@ -12,6 +11,22 @@ from openpyxl.styles import Alignment, Font, PatternFill
 from processors.base import BaseDocumentProcessor
 
 
+def _iter_text_slots(content: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Cell dicts whose text gets translated, in translation order"""
+    for sheet_data in content["worksheets"]:
+        for cell_data in sheet_data["cells"]:
+            # Only translate text cells, not numbers or formulas
+            if isinstance(cell_data["text"], str) and cell_data["text"].strip():
+                # Simple check to avoid translating numbers
+                try:
+                    float(cell_data["text"])
+                    # Skip if it's a number
+                    continue
+                except ValueError:
+                    # It's text
+                    yield cell_data
+
+
 class XLSXProcessor(BaseDocumentProcessor):
     """Processor for XLSX documents"""
 
@@ -90,22 +105,7 @@ class XLSXProcessor(BaseDocumentProcessor):
 
     def get_translatable_texts(self, extracted_content: Dict[str, Any]) -> List[str]:
         """Extract all translatable texts from XLSX content"""
-        texts = []
-
-        for sheet_data in extracted_content["worksheets"]:
-            for cell_data in sheet_data["cells"]:
-                # Only translate text cells, not numbers or formulas
-                if isinstance(cell_data["text"], str) and cell_data["text"].strip():
-                    # Simple check to avoid translating numbers
-                    try:
-                        float(cell_data["text"])
-                        # Skip if it's a number
-                        continue
-                    except ValueError:
-                        # It's text, add to translation list
-                        texts.append(cell_data["text"])
-
-        return texts
+        return [cell_data["text"] for cell_data in _iter_text_slots(extracted_content)]
 
     def get_pairs_translation(
         self, translated_content: Dict[str, Any],
@@ -121,24 +121,26 @@ class XLSXProcessor(BaseDocumentProcessor):
         return pairs
 
     def apply_translations(
-        self, extracted_content: Dict[str, Any], translations: List[str]
+        self,
+        extracted_content: Dict[str, Any],
+        translations: List[str],
+        in_place: bool = False,
     ) -> Dict[str, Any]:
-        """Apply translations to XLSX content structure"""
-        translated_content = copy.deepcopy(extracted_content)
-        translation_idx = 0
-
-        for sheet_data in translated_content["worksheets"]:
-            for cell_data in sheet_data["cells"]:
-                # Only apply translations to text cells
-                if isinstance(cell_data["text"], str) and cell_data["text"].strip():
-                    try:
-                        float(cell_data["text"])
-                        # Skip numbers
-                        continue
-                    except ValueError:
-                        # It's text, apply translation
-                        if translation_idx < len(translations):
-                            cell_data["text"] = translations[translation_idx]
-                            translation_idx += 1
+        """Apply translations to XLSX content structure (into extracted_content itself if in_place)"""
+        if in_place:
+            translated_content = extracted_content
+        else:
+            # Copy only the cell dicts; font metadata is shared, not copied
+            translated_content = {
+                **extracted_content,
+                "worksheets": [
+                    {**sheet_data, "cells": [dict(cell_data) for cell_data in sheet_data["cells"]]}
+                    for sheet_data in extracted_content["worksheets"]
+                ],
+            }
+
+        # Same walk as get_translatable_texts; zip stops at the shorter one
+        for cell_data, translation in zip(_iter_text_slots(translated_content), translations):
+            cell_data["text"] = translation
 
         return translated_content
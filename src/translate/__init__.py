@@ -2,9 +2,36 @@
 Translation services package
 """
 
-from .azure_translator import AzureTranslator
+import importlib
+
 from .base import BaseTranslator
-from .google_base import GoogleTranslator
-from .openai_translator import OpenAITranslator
 
-__all__ = ["BaseTranslator", "GoogleTranslator", "AzureTranslator", "OpenAITranslator"]
+# Translators load on first access, so importing one backend doesn't pull in every SDK
+_LAZY_TRANSLATORS = {
+    "GoogleTranslator": ".google_base",
+    "AzureTranslator": ".azure_translator",
+    "AzureTranslatorError": ".azure_translator",
+    "OpenAITranslator": ".openai_translator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_TRANSLATORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_TRANSLATORS))
+
+
+__all__ = [
+    "BaseTranslator",
+    "GoogleTranslator",
+    "AzureTranslator",
+    "AzureTranslatorError",
+    "OpenAITranslator",
+]
@@ -1,11 +1,73 @@
-import os
-from typing import Dict, List, Optional
+import gzip
+import importlib.util
+import json
+import random
+import secrets
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from azure.ai.translation.text import TextTranslationClient
-from azure.core.credentials import AzureKeyCredential
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from models.enums import SupportedLanguage
 
 from .base import BaseTranslator
 
+# Azure Translator REST API version
+API_VERSION = "3.0"
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse a JSON response body"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# HTTP/2 needs the optional h2 package; without it the client stays on HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Request bodies at least this large are gzipped when compression is enabled
+COMPRESS_MIN_BYTES = 1024
+
+# Statuses worth retrying: throttling and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Per-request limits: Azure accepts 100 items and 50,000 characters; keep a margin on the latter
+MAX_BATCH_ITEMS = 100
+MAX_BATCH_CHARS = 45_000
+
+# Codes that differ between SupportedLanguage / ISO 639-1 and Azure Translator
+_AZURE_LANG = {
+    SupportedLanguage.CHINESE: "zh-Hans",
+    SupportedLanguage.NORWEGIAN: "nb",
+    "zh": "zh-Hans",
+    "no": "nb",
+}
+
+
+def _to_azure_lang(lang: Union[SupportedLanguage, str]) -> str:
+    """Azure Translator code for a SupportedLanguage or plain language code"""
+    return _AZURE_LANG.get(lang) or getattr(lang, "value", lang)
+
+
+class AzureTranslatorError(Exception):
+    """Azure Translator request failed"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class AzureTranslator(BaseTranslator):
     def __init__(
@@ -13,26 +75,281 @@ class AzureTranslator(BaseTranslator):
         api_key: str,
         region: str = "global",
         endpoint: str = "https://api.cognitive.microsofttranslator.com",
+        max_concurrency: int = 16,
+        enable_trace_id: bool = False,
+        http2: bool = False,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        workers: int = 4,
+        languages_ttl: float = 24 * 3600,
+        compress_requests: bool = False,
     ):
+        """
+        Initialize Azure translator
+
+        Args:
+            api_key: Azure Translator subscription key
+            region: Azure resource region
+            endpoint: Translator API endpoint
+            max_concurrency: Requests allowed in flight at once; Azure accepts up to
+                about 100 concurrent requests per resource, 16 leaves room for other clients
+            enable_trace_id: Send a random X-ClientTraceId with each request for tracing
+            http2: Multiplex concurrent requests over one HTTP/2 connection (needs h2)
+            max_retries: Retries per request after throttling or transient failures
+            backoff_base: First retry delay in seconds, doubled on each further retry
+            workers: Threads sending the chunks of a large batch
+            languages_ttl: Seconds a fetched supported-languages list is reused
+            compress_requests: Gzip request bodies of 1 KB or more
+        """
         super().__init__()
         self.api_key = api_key
         self.region = region
         self.endpoint = endpoint
-        credential = AzureKeyCredential(api_key)
-        self.client = TextTranslationClient(
-            endpoint=self.endpoint, credential=credential, region=self.region
-        )
+        self.max_concurrency = max_concurrency
+        self.enable_trace_id = enable_trace_id
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.workers = workers
+        self.languages_ttl = languages_ttl
+        self.compress_requests = compress_requests
+        self._languages_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._client: Optional[httpx.Client] = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """HTTP client shared by all calls, so connections are kept alive between requests"""
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.endpoint,
+                http2=self.http2,
+                headers={
+                    "Ocp-Apim-Subscription-Key": self.api_key,
+                    "Ocp-Apim-Subscription-Region": self.region,
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": "gzip",
+                },
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=75,
+                ),
+                timeout=30,
+            )
+        return self._client
+
+    def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def translate_text(
-        self, text: str, target_lang: str = "vi", source_lang: Optional[str] = None
+        self,
+        text: str,
+        target_lang: str = "vi",
+        source_lang: Optional[str] = None,
+        custom_dict: Optional[Dict[str, str]] = None,
     ) -> str:
         """Translate a single text block"""
         if not text.strip():
             return text
+        return self._post_batch([text], target_lang, source_lang, custom_dict)[0]
+
+    def translate_texts(
+        self,
+        texts: List[str],
+        target_lang: str = "vi",
+        source_lang: Optional[str] = None,
+        custom_dict: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """Translate a list of text blocks, split into requests within Azure's limits"""
+        # Each distinct non-blank text is sent once; blank texts come back unchanged
+        unique = dict.fromkeys(text for text in texts if text.strip())
+        if not unique:
+            return list(texts)
+        unique_texts = list(unique)
+
+        chunks = list(_chunk_texts(enumerate(unique_texts)))
+        if len(chunks) == 1:
+            translated = self._post_batch(unique_texts, target_lang, source_lang, custom_dict)
+        else:
+            translated: List[Optional[str]] = [None] * len(unique_texts)
+            for i, translated_text in self._stream_chunks(
+                iter(chunks), target_lang, source_lang, custom_dict
+            ):
+                translated[i] = translated_text
+
+        unique.update(zip(unique_texts, translated))
+        return [unique.get(text, text) for text in texts]
+
+    def translate_stream(
+        self,
+        items: Iterable[Tuple[int, str]],
+        target_lang: str = "vi",
+        source_lang: Optional[str] = None,
+        custom_dict: Optional[Dict[str, str]] = None,
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Translate (index, text) pairs as they are produced
+
+        Args:
+            items: Iterable of (index, text) pairs, consumed lazily
+            target_lang: Target language code (default: "vi" for Vietnamese)
+            source_lang: Source language code (optional)
+            custom_dict: Custom dictionary applied to the translations
+
+        Yields:
+            (index, translated text) pairs, in the order their requests complete;
+            blank texts are not sent and come back unchanged at the end
+        """
+        blanks = []
+
+        def translatable() -> Iterator[Tuple[int, str]]:
+            for i, text in items:
+                if text.strip():
+                    yield i, text
+                else:
+                    blanks.append((i, text))
+
+        yield from self._stream_chunks(
+            _chunk_texts(translatable()), target_lang, source_lang, custom_dict
+        )
+        yield from blanks
+
+    def _stream_chunks(
+        self,
+        chunks: Iterator[Tuple[List[int], List[str]]],
+        target_lang: str,
+        source_lang: Optional[str],
+        custom_dict: Optional[Dict[str, str]],
+    ) -> Iterator[Tuple[int, str]]:
+        """Run chunks on the worker pool, keeping at most two chunks per worker pending"""
+
+        def translate_chunk(indices: List[int], chunk: List[str]) -> List[Tuple[int, str]]:
+            return list(zip(indices, self._post_batch(chunk, target_lang, source_lang, custom_dict)))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = set()
+            for indices, chunk in chunks:
+                pending.add(pool.submit(translate_chunk, indices, chunk))
+                if len(pending) >= self.workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            for future in as_completed(pending):
+                yield from future.result()
+
+    def get_supported_languages(self, scope: str = "translation") -> Dict[str, Any]:
+        """Languages supported by Azure Translator, fetched once per TTL (the list rarely changes)"""
+        cached = self._languages_cache.get(scope)
+        if cached is not None and time.monotonic() - cached[0] < self.languages_ttl:
+            return cached[1]
+        languages = self._request("GET", "/languages", params={"scope": scope})
+        self._languages_cache[scope] = (time.monotonic(), languages)
+        return languages
+
+    def _post_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: Optional[str],
+        custom_dict: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """Translate one request's worth of texts, then apply the custom dictionary"""
+        params = {"to": _to_azure_lang(target_lang)}
+        if source_lang:
+            params["from"] = _to_azure_lang(source_lang)
+        # Serialized straight to bytes; translate_text sends a one-item batch through here too
+        result = self._request(
+            "POST", "/translate", params=params, content=_dumps([{"text": text} for text in texts])
+        )
         try:
-            response = self.client.translate(
-                content=[text], to=[target_lang], from_parameter=source_lang
-            )
-            return response[0].translations[0].text if response else ""
-        except Exception as e:
-            raise Exception(f"Translation error: {e}")
+            translated = [item["translations"][0]["text"] for item in result]
+        except (KeyError, IndexError, TypeError) as e:
+            raise AzureTranslatorError(f"Translation error: unexpected response: {e}") from e
+        # Runs on this chunk's worker thread, overlapping the other chunks' requests
+        return self._apply_custom_dictionary_bulk(translated, custom_dict)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, str]] = None,
+        body: Any = None,
+        content: Optional[bytes] = None,
+    ) -> Any:
+        """Send one API request and return its parsed JSON
+
+        The JSON body is given either as an object (body) or already serialized (content).
+        Adds the API version, trace id and body compression, holds a concurrency slot
+        while the request is in flight, and retries throttling, server errors and
+        dropped connections with backoff so one failing chunk doesn't fail a batch.
+        """
+        params = {"api-version": API_VERSION, **(params or {})}
+        headers = {"X-ClientTraceId": secrets.token_hex(16)} if self.enable_trace_id else {}
+        if body is not None:
+            content = _dumps(body)
+        if content is not None and self.compress_requests and len(content) >= COMPRESS_MIN_BYTES:
+            content = gzip.compress(content, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._slots:
+                    response = self.client.request(
+                        method, path, params=params, headers=headers, content=content
+                    )
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise AzureTranslatorError(f"Azure Translator request failed: {e}") from e
+                time.sleep(self._retry_delay(attempt))
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                time.sleep(self._retry_delay(attempt, response.headers.get("Retry-After")))
+                continue
+            if response.is_error:
+                raise AzureTranslatorError(
+                    f"Azure Translator request failed: HTTP {response.status_code}: {response.text}",
+                    status_code=response.status_code,
+                )
+            try:
+                return _loads(response.content)
+            except ValueError as e:
+                raise AzureTranslatorError(f"Azure Translator returned invalid JSON: {e}") from e
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before a retry: the server's Retry-After, else exponential backoff"""
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = self.backoff_base * 2 ** attempt
+        return delay + random.uniform(0, 0.25)
+
+
+def _chunk_texts(
+    items: Iterable[Tuple[int, str]],
+    max_items: int = MAX_BATCH_ITEMS,
+    max_chars: int = MAX_BATCH_CHARS,
+) -> Iterator[Tuple[List[int], List[str]]]:
+    """Pack (index, text) pairs, in order, into chunks within the item and character limits"""
+    indices: List[int] = []
+    chunk: List[str] = []
+    chunk_chars = 0
+    for i, text in items:
+        if chunk and (len(chunk) == max_items or chunk_chars + len(text) > max_chars):
+            yield indices, chunk
+            indices, chunk, chunk_chars = [], [], 0
+        indices.append(i)
+        chunk.append(text)
+        chunk_chars += len(text)
+    if chunk:
+        yield indices, chunk
@@ -1,6 +1,112 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from operator import itemgetter
+from typing import Any, Callable, Collection, Dict, List, Pattern, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Dictionaries with more terms than this use an Aho-Corasick automaton when available
+AHOCORASICK_MIN_TERMS = 32
+
+
+@lru_cache(maxsize=64)
+def _compile_dictionary(
+    items: Collection[Tuple[str, str]]
+) -> Tuple[Pattern[str], Dict[str, str]]:
+    """Case-insensitive alternation of the dictionary terms, plus a lowercase term lookup"""
+    mapping = {}
+    # Sorted, so terms differing only in case resolve the same way whatever the dict order
+    for source_term, target_term in sorted(items, key=itemgetter(0)):
+        if source_term:
+            mapping.setdefault(source_term.lower(), (source_term, target_term))
+    # Longest first so a term wins over any term it contains
+    alternation = "|".join(
+        re.escape(term) for term in sorted(mapping, key=len, reverse=True)
+    )
+    return re.compile(alternation or r"(?!)", re.IGNORECASE), mapping
+
+
+@lru_cache(maxsize=64)
+def _compile_automaton(items: Collection[Tuple[str, str]]):
+    """Aho-Corasick automaton over the lowercased dictionary terms"""
+    automaton = ahocorasick.Automaton()
+    for source_term, target_term in sorted(items, key=itemgetter(0)):
+        key = source_term.lower()
+        if key and key not in automaton:
+            automaton.add_word(key, (len(key), source_term, target_term))
+    automaton.make_automaton()
+    return automaton
+
+
+def _replace_with_automaton(automaton, text: str, lowered: str) -> str:
+    """Leftmost-longest, non-overlapping replacement of automaton matches"""
+    matches = sorted(
+        (end - length + 1, -length, source_term, target_term)
+        for end, (length, source_term, target_term) in automaton.iter(lowered)
+    )
+    if not matches:
+        return text
+    parts = []
+    pos = 0
+    for start, neg_length, source_term, target_term in matches:
+        if start < pos:
+            continue
+        end = start - neg_length
+        parts.append(text[pos:start])
+        parts.append(_match_case(text[start:end], source_term, target_term))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _match_case(found: str, source_term: str, target_term: str) -> str:
+    """Target term cased like the text that matched the source term"""
+    if found == source_term:
+        return target_term
+    if found.isupper():
+        return target_term.upper()
+    if found.islower():
+        return target_term.lower()
+    if found == found.capitalize():
+        return target_term.capitalize()
+    return target_term
+
+
+def _dictionary_replacer(custom_dict: Dict[str, str]) -> Callable[[str], str]:
+    """Function applying the dictionary to one text, with its matchers compiled (and cached)"""
+    use_automaton = ahocorasick is not None and len(custom_dict) > AHOCORASICK_MIN_TERMS
+    try:
+        # The same dictionary content hits the cache whatever its insertion order
+        items = frozenset(custom_dict.items())
+        pattern, mapping = _compile_dictionary(items)
+        automaton = _compile_automaton(items) if use_automaton else None
+    except TypeError:
+        # Unhashable values can't key the cache; compile for this call only
+        items = tuple(custom_dict.items())
+        pattern, mapping = _compile_dictionary.__wrapped__(items)
+        automaton = _compile_automaton.__wrapped__(items) if use_automaton else None
+
+    def replace_match(match) -> str:
+        found = match.group(0)
+        terms = mapping.get(found.lower())
+        return _match_case(found, *terms) if terms else found
+
+    def replace(text: str) -> str:
+        if automaton is not None:
+            lowered = text.lower()
+            # Spans in the lowered text only line up when lowering kept the length
+            if len(lowered) == len(text):
+                return _replace_with_automaton(automaton, text, lowered)
+        # One pass of a compiled case-insensitive alternation; each match keeps its casing
+        return pattern.sub(replace_match, text)
+
+    return replace
 
 
 class BaseTranslator(ABC):
@@ -11,7 +117,30 @@ class BaseTranslator(ABC):
         """Translate a single text block"""
         pass
 
-    @abstractmethod
-    def translate_texts(self, texts: List[str]) -> List[str]:
-        """Translate a list of text blocks"""
-        pass
+    def translate_texts(self, texts: List[str], *args, **kwargs) -> List[str]:
+        """Translate a list of text blocks
+
+        Default for backends without a batch API: translate_text runs on a thread pool
+        bounded by the translator's max_concurrency (8 if unset). Extra arguments are
+        passed through to translate_text.
+        """
+        if len(texts) <= 1:
+            return [self.translate_text(text, *args, **kwargs) for text in texts]
+        workers = min(getattr(self, "max_concurrency", 8), len(texts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda text: self.translate_text(text, *args, **kwargs), texts))
+
+    def _apply_custom_dictionary(self, text: str, custom_dict: Dict[str, str]) -> str:
+        """Apply custom dictionary replacements to translated text"""
+        if not custom_dict:
+            return text
+        return _dictionary_replacer(custom_dict)(text)
+
+    def _apply_custom_dictionary_bulk(
+        self, texts: List[str], custom_dict: Dict[str, str]
+    ) -> List[str]:
+        """Apply custom dictionary replacements to many texts, resolving the matcher once"""
+        if not custom_dict:
+            return texts
+        replace = _dictionary_replacer(custom_dict)
+        return [replace(text) for text in texts]
@@ -1,35 +1,286 @@
 import asyncio
+import atexit
 import hashlib
 import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from functools import lru_cache, wraps
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from googletrans import Translator
 
 from .base import BaseTranslator
 
+# googletrans calls allowed in flight at once
+MAX_CONCURRENCY = 16
+
+# Consecutive texts shorter than SHORT_TEXT_CHARS are joined with SEGMENT_SEPARATOR into
+# one call of up to BATCH_CHARS characters, and the translation is split back apart
+SHORT_TEXT_CHARS = 200
+BATCH_CHARS = 2000
+SEGMENT_MARKER = "⟦§⟧"
+SEGMENT_SEPARATOR = f"\n{SEGMENT_MARKER}\n"
+
+# Target language when the caller doesn't give one
+TARGET_LANG = "vi"
+
+# Translations saved at exit and reloaded by the next run
+CACHE_PATH = Path(os.path.expanduser("~/.cache/agent-translate/google.json"))
+
+# Default limits of the shared cache; an instance may only raise them (see configure_cache)
+CACHE_SIZE = 1000
+CACHE_TTL = 3600
+
 
 class GoogleTranslator(BaseTranslator):
-    def __init__(self, cache_size: int = 1000, cache_ttl: int = 3600):
-        self.translator = Translator()
-        self.cache_size = cache_size
-        self.cache_ttl = cache_ttl
+    # (text, target_lang) -> (translated at, translation), least recently used first; shared
+    # by every instance (one is built per document) and written to CACHE_PATH at exit
+    _cache: Optional["OrderedDict[Tuple[str, str], Tuple[float, str]]"] = None
+    _cache_lock = threading.Lock()
+    # Limits of the shared cache, applied the same way by every instance and on load
+    _cache_size: int = CACHE_SIZE
+    _cache_ttl: float = CACHE_TTL
+
+    # Event loop running every googletrans call on a daemon thread, and the Translator
+    # (one HTTP client) used on it; both started once per process and reused
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _shared_translator: Optional[Translator] = None
+    _loop_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        batch_chars: int = BATCH_CHARS,
+    ):
+        self.translator = self._get_shared_translator()
+        self.max_concurrency = max_concurrency
+        self.batch_chars = batch_chars
+        self.configure_cache(cache_size, cache_ttl)
+
+    @classmethod
+    def configure_cache(cls, cache_size: Optional[int] = None, cache_ttl: Optional[float] = None):
+        """
+        Raise the shared cache's limits and load the saved cache on first use
+
+        Args:
+            cache_size: Entries to keep; the largest size any caller asked for wins
+            cache_ttl: Seconds a translation is reused; the longest any caller asked for wins
+        """
+        with cls._cache_lock:
+            grown = cache_size is not None and cache_size > cls._cache_size
+            if grown:
+                cls._cache_size = cache_size
+            if cache_ttl is not None and cache_ttl > cls._cache_ttl:
+                cls._cache_ttl = cache_ttl
+
+            if cls._cache is None:
+                cls._cache = _load_cache(CACHE_PATH, cls._cache_size, cls._cache_ttl)
+                atexit.register(cls.save_cache)
+            elif grown:
+                # Rows the smaller limit left on disk fit now; they go in as least recently used
+                saved = _load_cache(CACHE_PATH, cls._cache_size, cls._cache_ttl)
+                for key in cls._cache:
+                    saved.pop(key, None)
+                saved.update(cls._cache)
+                while len(saved) > cls._cache_size:
+                    saved.popitem(last=False)
+                cls._cache = saved
 
-    def translate_text(self, text):
-        return asyncio.run(self.translator.translate(text, dest="vi").text)
+    def translate_text(
+        self, text: str, target_lang: str = TARGET_LANG, source_lang: Optional[str] = None
+    ) -> str:
+        cached = self._cache_get(text, target_lang)
+        if cached is not None:
+            return cached
+        return self.translate_texts([text], target_lang, source_lang)[0]
 
-    def translate_texts(self, texts: List[str]) -> List[str]:
+    def translate_texts(
+        self,
+        texts: List[str],
+        target_lang: str = TARGET_LANG,
+        source_lang: Optional[str] = None,
+    ) -> List[str]:
         """
         Translate multiple texts efficiently with caching
         """
+        if not texts:
+            return []
+
+        # Only distinct texts missing from the cache go to Google
+        translated = {}
+        misses = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get(text, target_lang)
+            if cached is None:
+                misses.append(text)
+            else:
+                translated[text] = cached
+
+        if misses:
+            results = self._run(self.translate_texts_async(misses, target_lang, source_lang))
+            translated.update(zip(misses, results))
+            self._cache_put(zip(misses, results), target_lang)
+
+        return [translated[text] for text in texts]
+
+    @classmethod
+    def _get_shared_translator(cls) -> Translator:
+        with cls._loop_lock:
+            if cls._shared_translator is None:
+                cls._shared_translator = Translator()
+            return cls._shared_translator
+
+    @classmethod
+    def _event_loop(cls) -> asyncio.AbstractEventLoop:
+        """The persistent loop, started on first use and stopped at exit"""
+        with cls._loop_lock:
+            if cls._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="google-translate-loop", daemon=True
+                ).start()
+                atexit.register(loop.call_soon_threadsafe, loop.stop)
+                cls._loop = loop
+            return cls._loop
+
+    def _run(self, coro):
+        """Run a coroutine on the persistent loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._event_loop()).result()
+
+    def _cache_get(self, text: str, target_lang: str) -> Optional[str]:
+        """Cached translation of text, unless missing or older than the cache TTL"""
+        key = (text, target_lang)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= GoogleTranslator._cache_ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(self, pairs: Iterable[Tuple[str, str]], target_lang: str):
+        """Store translations, evicting the least recently used beyond the cache size"""
+        now = time.time()
+        with self._cache_lock:
+            for text, translation in pairs:
+                key = (text, target_lang)
+                self._cache[key] = (now, translation)
+                self._cache.move_to_end(key)
+            while len(self._cache) > GoogleTranslator._cache_size:
+                self._cache.popitem(last=False)
+
+    @classmethod
+    def save_cache(cls, path: Path = CACHE_PATH):
+        """Write the shared translation cache to disk (registered to run at exit)"""
+        with cls._cache_lock:
+            if not cls._cache:
+                return
+            rows = [
+                [text, lang, ts, translation]
+                for (text, lang), (ts, translation) in cls._cache.items()
+            ]
+        # Per-process temp file, so workers exiting together don't write over each other
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    async def translate_texts_async(
+        self,
+        texts: List[str],
+        target_lang: str = TARGET_LANG,
+        source_lang: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Translate texts with short ones fused into shared calls, max_concurrency calls in flight
+
+        Args:
+            texts: Texts to translate
+            target_lang: Language to translate into
+            source_lang: Language of the texts (detected when None)
+
+        Returns:
+            Translations in the same order as texts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def translate_one(text: str) -> str:
+            async with semaphore:
+                result = await self.translator.translate(
+                    text, dest=target_lang, src=source_lang or "auto"
+                )
+            return result.text
+
+        async def translate_group(group: List[str]) -> List[str]:
+            if len(group) == 1:
+                return [await translate_one(group[0])]
+            joined = await translate_one(SEGMENT_SEPARATOR.join(group))
+            parts = [part.strip() for part in joined.split(SEGMENT_MARKER)]
+            if len(parts) == len(group):
+                return parts
+            # The separator didn't survive translation; send the texts one by one
+            return list(await asyncio.gather(*(translate_one(text) for text in group)))
+
+        groups = await asyncio.gather(
+            *(translate_group(group) for group in self._group_texts(texts))
+        )
+        return [text for group in groups for text in group]
+
+    def _group_texts(self, texts: List[str]) -> Iterator[List[str]]:
+        """Pack consecutive short texts, in order, into groups of at most batch_chars characters"""
+        group: List[str] = []
+        group_chars = 0
+        for text in texts:
+            if len(text) >= SHORT_TEXT_CHARS or SEGMENT_MARKER in text:
+                if group:
+                    yield group
+                    group, group_chars = [], 0
+                yield [text]
+                continue
+            added = len(text) + len(SEGMENT_SEPARATOR)
+            if group and group_chars + added > self.batch_chars:
+                yield group
+                group, group_chars = [], 0
+            group.append(text)
+            group_chars += added
+        if group:
+            yield group
+
+def _load_cache(
+    path: Path, max_size: int, ttl: float
+) -> "OrderedDict[Tuple[str, str], Tuple[float, str]]":
+    """
+    Translation cache saved by a previous run; empty if missing or unreadable
 
-        # Use asyncio to handle multiple translations concurrently
-        async def translate_all():
-            tasks = [self.translator.translate(text, dest="vi") for text in texts]
-            return await asyncio.gather(*tasks)
+    Args:
+        path: File written by GoogleTranslator.save_cache
+        max_size: Most recently used entries to keep
+        ttl: Seconds after which a saved translation is dropped instead of loaded
 
-        results = asyncio.run(translate_all())
-        return [result.text for result in results]
+    Returns:
+        The entries, least recently used first
+    """
+    cache = OrderedDict()
+    try:
+        rows = json.loads(path.read_text(encoding="utf-8"))
+        oldest = time.time() - ttl
+        # Rows are saved least recently used first, so the tail is what to keep
+        for text, lang, ts, translation in rows[-max_size:] if max_size > 0 else ():
+            if ts > oldest:
+                cache[(text, lang)] = (ts, translation)
+    except (OSError, ValueError, TypeError):
+        cache.clear()
+    return cache
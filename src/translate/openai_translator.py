@@ -1,16 +1,88 @@
+import json
 import os
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import openai
 
 from .base import BaseTranslator
 
+# Upper bound for the input-scaled max_tokens of a request, per model family
+# (dated snapshots such as gpt-4o-2024-08-06 match by prefix)
+MODEL_OUTPUT_TOKENS = {
+    "gpt-4o-mini": 16_384,
+    "gpt-4o": 16_384,
+    "gpt-4-turbo": 4_096,
+    "gpt-3.5-turbo": 4_096,
+}
+# Models not in the table get the limit every chat model accepts
+DEFAULT_OUTPUT_TOKENS = 4_096
+
+
+def _output_token_limit(model: str) -> int:
+    """Largest max_tokens the model accepts; longest matching prefix wins"""
+    for prefix in sorted(MODEL_OUTPUT_TOKENS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_OUTPUT_TOKENS[prefix]
+    return DEFAULT_OUTPUT_TOKENS
+
+# Language mapping for better prompts
+LANGUAGE_NAMES = {
+    "vi": "Vietnamese",
+    "en": "English",
+    "zh": "Chinese",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "fr": "French",
+    "de": "German",
+    "es": "Spanish",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "ru": "Russian",
+    "ar": "Arabic",
+    "hi": "Hindi",
+    "th": "Thai",
+}
+
+_SYSTEM_PROMPT_HEADER = """You are a professional translator. Translate the following text from {source} to {target}.
+
+Requirements:
+- Maintain the original formatting and structure exactly
+- Keep technical terms accurate and appropriate
+- Preserve the tone, style, and meaning
+- Do not add explanations or additional content
+- Return only the translated text
+- If text contains code, URLs, or special formatting, preserve them exactly
+- Pay special attention to glossary terms marked with __GLOSSARY_TERM_X__ patterns - these should be translated according to the provided glossary"""
+
+_BATCH_SYSTEM_PROMPT_HEADER = """You are a professional translator. Translate the following numbered text segments from {source} to {target}.
+
+Requirements:
+- Translate each numbered item and return them in the EXACT same numbered format
+- Maintain consistency in terminology and style across all translations
+- Preserve the original formatting and structure of each segment
+- Keep technical terms accurate and appropriate
+- Preserve the tone, style, and meaning
+- Do not add explanations or additional content
+- If text contains code, URLs, or special formatting, preserve them exactly
+- Pay special attention to glossary terms marked with __GLOSSARY_TERM_X__ patterns
+- Use the document context to ensure consistent translation of repeated terms and concepts
+
+Format your response as:
+1. [First translation]
+2. [Second translation]
+3. [Third translation]
+... and so on"""
+
 
 class OpenAITranslator(BaseTranslator):
     """OpenAI-based translator implementation"""
 
     def __init__(
-        self, api_key: str, model: str = "gpt-4-turbo-preview", temperature: float = 0.1
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.1,
+        max_tokens_ratio: float = 2.0,
     ):
         """
         Initialize OpenAI translator
@@ -19,11 +91,14 @@ class OpenAITranslator(BaseTranslator):
             api_key: OpenAI API key
             model: OpenAI model to use for translation
             temperature: Model temperature for translation consistency
+            max_tokens_ratio: Output token budget per input character
         """
         super().__init__()
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
+        self.max_tokens_ratio = max_tokens_ratio
+        self.max_output_tokens = _output_token_limit(model)
         self.client = openai.OpenAI(api_key=api_key)
 
     def translate_text(
@@ -82,6 +157,7 @@ class OpenAITranslator(BaseTranslator):
                     {"role": "user", "content": preprocessed_text},
                 ],
                 temperature=self.temperature,
+                max_tokens=self._max_tokens(preprocessed_text),
             )
 
             translated = response.choices[0].message.content
@@ -97,6 +173,67 @@ class OpenAITranslator(BaseTranslator):
         except Exception as e:
             raise Exception(f"OpenAI translation error: {e}")
 
+    def stream_translate_text(
+        self,
+        text: str,
+        target_lang: str = "vi",
+        source_lang: Optional[str] = None,
+        context: Optional[str] = None,
+        glossary: Optional[Dict[str, str]] = None,
+    ) -> Iterator[str]:
+        """
+        Translate a single text block, yielding the translation progressively
+
+        Args:
+            text: Text to translate
+            target_lang: Target language code (default: "vi" for Vietnamese)
+            source_lang: Source language code (optional)
+            context: Additional context for translation
+            glossary: Glossary/Dictionary for specific term translations
+
+        Yields:
+            Pieces of the translated text as the model produces them. With a glossary the
+            terms can only be restored on the full text, so it is yielded once at the end.
+        """
+        if not text.strip():
+            yield text
+            return
+
+        preprocessed_text, glossary_markers = (
+            self._preprocess_with_glossary(text, glossary) if glossary else (text, {})
+        )
+        system_prompt = self._build_system_prompt(
+            target_lang, source_lang, context, glossary
+        )
+
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": preprocessed_text},
+            ],
+            temperature=self.temperature,
+            max_tokens=self._max_tokens(preprocessed_text),
+            stream=True,
+        )
+
+        pieces = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            if glossary:
+                pieces.append(delta)
+            else:
+                yield delta
+
+        if glossary:
+            yield self._postprocess_with_glossary(
+                "".join(pieces), glossary_markers, glossary
+            )
+
     def translate_texts(
         self,
         texts: List[str],
@@ -107,7 +244,7 @@ class OpenAITranslator(BaseTranslator):
         glossary: Optional[Dict[str, str]] = None,
     ) -> List[str]:
         """
-        Translate a list of text blocks
+        Translate a list of text blocks (concurrently, one request per text)
 
         Args:
             texts: List of texts to translate
@@ -120,13 +257,97 @@ class OpenAITranslator(BaseTranslator):
         Returns:
             List of translated texts
         """
-        results = []
+        return super().translate_texts(
+            texts, target_lang, source_lang, context, custom_dict, glossary
+        )
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str = "vi",
+        source_lang: Optional[str] = None,
+        context: Optional[str] = None,
+        glossary: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
+        """
+        Translate a list of text blocks in a single request, sent as a JSON array
+
+        Args:
+            texts: List of texts to translate
+            target_lang: Target language code (default: "vi" for Vietnamese)
+            source_lang: Source language code (optional)
+            context: Additional context for translation
+            glossary: Glossary/Dictionary for specific term translations
+
+        Returns:
+            List of translated texts in the same order as input
+
+        Raises:
+            ValueError: If the reply is not a JSON array with one item per input text
+        """
+        if not texts:
+            return []
+
+        # Blank texts come back unchanged instead of being sent to the model
+        positions = [i for i, text in enumerate(texts) if text.strip()]
+        if len(positions) < len(texts):
+            results = list(texts)
+            if positions:
+                translated = self.translate_batch(
+                    [texts[i] for i in positions], target_lang, source_lang, context, glossary
+                )
+                for i, translated_text in zip(positions, translated):
+                    results[i] = translated_text
+            return results
+
+        preprocessed_batch = []
+        batch_glossary_markers = []
         for text in texts:
-            translated = self.translate_text(
-                text, target_lang, source_lang, context, custom_dict, glossary
+            if glossary:
+                preprocessed_text, glossary_markers = self._preprocess_with_glossary(
+                    text, glossary
+                )
+            else:
+                preprocessed_text, glossary_markers = text, {}
+            preprocessed_batch.append(preprocessed_text)
+            batch_glossary_markers.append(glossary_markers)
+
+        system_prompt = self._build_system_prompt(
+            target_lang, source_lang, context, glossary
+        )
+        system_prompt += (
+            "\n\nThe input is a JSON array of texts. Translate every item and return "
+            "only a JSON array of the translations, in the same order and with the same "
+            "number of items."
+        )
+
+        user_content = json.dumps(preprocessed_batch, ensure_ascii=False)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content},
+            ],
+            temperature=self.temperature,
+            max_tokens=self._max_tokens(user_content),
+        )
+
+        reply = (response.choices[0].message.content or "").strip()
+        if reply.startswith("```"):
+            # Drop a markdown code fence around the array
+            reply = reply.split("\n", 1)[-1].rsplit("```", 1)[0]
+        translated = json.loads(reply)
+        if not isinstance(translated, list) or len(translated) != len(texts):
+            raise ValueError(
+                f"Expected a JSON array of {len(texts)} translations from the model"
             )
-            results.append(translated)
-        return results
+
+        return [
+            self._postprocess_with_glossary(str(item), markers, glossary)
+            if glossary
+            else str(item)
+            for item, markers in zip(translated, batch_glossary_markers)
+        ]
 
     def translate_texts_with_context(
         self,
@@ -221,6 +442,7 @@ class OpenAITranslator(BaseTranslator):
                         {"role": "user", "content": numbered_input.strip()},
                     ],
                     temperature=self.temperature,
+                    max_tokens=self._max_tokens(numbered_input),
                 )
 
                 translated_response = response.choices[0].message.content
@@ -278,6 +500,13 @@ class OpenAITranslator(BaseTranslator):
 
         return result
 
+    def _max_tokens(self, user_content: str) -> int:
+        """Output token budget scaled to the input, so short texts don't reserve the worst case"""
+        return min(
+            self.max_output_tokens,
+            max(64, int(len(user_content) * self.max_tokens_ratio) + 128),
+        )
+
     def _build_system_prompt(
         self,
         target_lang: str,
@@ -286,53 +515,10 @@ class OpenAITranslator(BaseTranslator):
         glossary: Optional[Dict[str, str]] = None,
     ) -> str:
         """Build system prompt for translation"""
-
-        # Language mapping for better prompts
-        lang_names = {
-            "vi": "Vietnamese",
-            "en": "English",
-            "zh": "Chinese",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "fr": "French",
-            "de": "German",
-            "es": "Spanish",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "ru": "Russian",
-            "ar": "Arabic",
-            "hi": "Hindi",
-            "th": "Thai",
-        }
-
-        target_lang_name = lang_names.get(target_lang, target_lang)
-        source_lang_name = (
-            lang_names.get(source_lang, source_lang)
-            if source_lang
-            else "the source language"
+        return self._assemble_prompt(
+            _SYSTEM_PROMPT_HEADER, target_lang, source_lang, context, glossary
         )
 
-        prompt = f"""You are a professional translator. Translate the following text from {source_lang_name} to {target_lang_name}.
-
-Requirements:
-- Maintain the original formatting and structure exactly
-- Keep technical terms accurate and appropriate
-- Preserve the tone, style, and meaning
-- Do not add explanations or additional content
-- Return only the translated text
-- If text contains code, URLs, or special formatting, preserve them exactly
-- Pay special attention to glossary terms marked with __GLOSSARY_TERM_X__ patterns - these should be translated according to the provided glossary"""
-
-        if context:
-            prompt += f"\n\nContext for translation: {context}"
-
-        if glossary:
-            prompt += f"\n\nGlossary/Dictionary (use these specific translations when the terms appear):"
-            for source_term, target_term in glossary.items():
-                prompt += f"\n- {source_term} → {target_term}"
-
-        return prompt
-
     def _build_batch_system_prompt(
         self,
         target_lang: str,
@@ -341,60 +527,41 @@ Requirements:
         glossary: Optional[Dict[str, str]] = None,
     ) -> str:
         """Build system prompt for batch translation"""
-
-        # Language mapping for better prompts
-        lang_names = {
-            "vi": "Vietnamese",
-            "en": "English",
-            "zh": "Chinese",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "fr": "French",
-            "de": "German",
-            "es": "Spanish",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "ru": "Russian",
-            "ar": "Arabic",
-            "hi": "Hindi",
-            "th": "Thai",
-        }
-
-        target_lang_name = lang_names.get(target_lang, target_lang)
-        source_lang_name = (
-            lang_names.get(source_lang, source_lang)
-            if source_lang
-            else "the source language"
+        return self._assemble_prompt(
+            _BATCH_SYSTEM_PROMPT_HEADER, target_lang, source_lang, context, glossary
         )
 
-        prompt = f"""You are a professional translator. Translate the following numbered text segments from {source_lang_name} to {target_lang_name}.
-
-Requirements:
-- Translate each numbered item and return them in the EXACT same numbered format
-- Maintain consistency in terminology and style across all translations
-- Preserve the original formatting and structure of each segment
-- Keep technical terms accurate and appropriate
-- Preserve the tone, style, and meaning
-- Do not add explanations or additional content
-- If text contains code, URLs, or special formatting, preserve them exactly
-- Pay special attention to glossary terms marked with __GLOSSARY_TERM_X__ patterns
-- Use the document context to ensure consistent translation of repeated terms and concepts
-
-Format your response as:
-1. [First translation]
-2. [Second translation]
-3. [Third translation]
-... and so on"""
+    @staticmethod
+    def _assemble_prompt(
+        header: str,
+        target_lang: str,
+        source_lang: Optional[str],
+        context: Optional[str],
+        glossary: Optional[Dict[str, str]],
+    ) -> str:
+        """Fill a precomputed prompt header and append the context and glossary sections"""
+        parts = [
+            header.format(
+                source=LANGUAGE_NAMES.get(source_lang, source_lang)
+                if source_lang
+                else "the source language",
+                target=LANGUAGE_NAMES.get(target_lang, target_lang),
+            )
+        ]
 
         if context:
-            prompt += f"\n\nContext for translation: {context}"
+            parts.append(f"\n\nContext for translation: {context}")
 
         if glossary:
-            prompt += f"\n\nGlossary/Dictionary (use these specific translations when the terms appear):"
-            for source_term, target_term in glossary.items():
-                prompt += f"\n- {source_term} → {target_term}"
+            parts.append(
+                "\n\nGlossary/Dictionary (use these specific translations when the terms appear):"
+            )
+            parts.extend(
+                f"\n- {source_term} → {target_term}"
+                for source_term, target_term in glossary.items()
+            )
 
-        return prompt
+        return "".join(parts)
 
     def _parse_numbered_response(self, response: str, expected_count: int) -> List[str]:
         """Parse numbered response from the model"""
@@ -530,23 +697,8 @@ Format your response as:
 
         return result
 
-    def _apply_custom_dictionary(self, text: str, custom_dict: Dict[str, str]) -> str:
-        """Apply custom dictionary replacements to translated text"""
-        if not custom_dict:
-            return text
-
-        for source_term, target_term in custom_dict.items():
-            # Case-sensitive replacement first
-            text = text.replace(source_term, target_term)
-            # Then case-insensitive variants
-            text = text.replace(source_term.lower(), target_term.lower())
-            text = text.replace(source_term.upper(), target_term.upper())
-            text = text.replace(source_term.capitalize(), target_term.capitalize())
-
-        return text
-
     @classmethod
-    def from_env(cls, model: str = "gpt-4-turbo-preview", temperature: float = 0.1):
+    def from_env(cls, model: str = "gpt-4o-mini", temperature: float = 0.1):
         """
         Create OpenAITranslator instance from environment variables
 
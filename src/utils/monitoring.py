@@ -46,6 +46,7 @@ class TranslationMonitor:
 
         # Check cache size
         checks["cache_size"] = len(self.agent.translation_engine.translation_cache)
+        checks["cache_stats"] = dict(self.agent.translation_engine.translation_cache.stats)
 
         # Check recent errors
         recent_errors = []